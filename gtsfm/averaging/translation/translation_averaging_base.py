@@ -98,8 +98,8 @@ class TranslationAveragingBase(GTSFMProcess):
             wRi_graph: List of global rotations wrapped up in Delayed.
             tracks_2d: 2d tracks wrapped up in Delayed.
             intrinsics: List of camera intrinsics.
-            absolute_pose_priors: Priors on the camera poses (not delayed).
-            i2Ti1_priors: Priors on the pose between camera pairs (not delayed) as (i1, i2): i2Ti1.
+            absolute_pose_priors: Priors on the camera poses (optionally wrapped as Delayed).
+            i2Ti1_priors: Priors on the pose between camera pairs (optionally wrapped as Delayed) as (i1, i2): i2Ti1.
             scale_factor: Non-negative global scaling factor.
             gt_wTi_list: List of ground truth poses (wTi) for computing metrics.
 
@@ -519,8 +519,8 @@ class BundleAdjustmentOptimizer:
 
         Args:
             sfm_data_graph: An GtsfmData object wrapped up using dask.delayed.
-            absolute_pose_priors: Priors on the poses of the cameras (not delayed).
-            relative_pose_priors: Priors on poses between cameras (not delayed).
+            absolute_pose_priors: Priors on the poses of the cameras (optionally wrapped as Delayed).
+            relative_pose_priors: Priors on poses between cameras (optionally wrapped as Delayed).
             cameras_gt: Ground truth camera calibration & pose for each image/camera.
             save_dir: Directory where artifacts and plots should be saved to disk.
 
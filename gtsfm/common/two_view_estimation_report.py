@@ -10,7 +10,7 @@ import numpy as np
 from gtsam import Rot3, Unit3
 
 
-@dataclass(frozen=False)
+@dataclass
 class TwoViewEstimationReport:
     """Information about verifier result on an edge between two nodes (i1,i2).
 
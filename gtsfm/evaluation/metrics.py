@@ -10,7 +10,7 @@ Authors: Akshay Krishnan
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import numpy as np
 
@@ -309,14 +309,15 @@ class GtsfmMetricsGroup:
             metrics_dict.update(metric.get_metric_as_dict())
         return {self._name: metrics_dict}
 
-    def save_to_json(self, path: str) -> None:
+    def save_to_json(self, path: Union[str, Sequence[str]]) -> None:
         """Saves the dictionary representation of the metrics group to json.
 
         Args:
-            path: Path to json file.
+            path: Path to json file, or several paths to write the same json to.
         """
+        paths = [path] if isinstance(path, str) else path
         try:
-            io.save_json_file(path, self.get_metrics_as_dict())
+            io.save_json_files(paths, self.get_metrics_as_dict())
         except Exception as e:
             logger.error("Error saving metric %s to json %s", self._name, e)
 
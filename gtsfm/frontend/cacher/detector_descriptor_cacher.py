@@ -54,17 +54,15 @@ class DetectorDescriptorCacher(DetectorDescriptorBase):
         input_key = cache_utils.generate_hash_for_image(image)
         return "{}_{}".format(self._detector_descriptor_obj_cache_key, input_key)
 
-    def __load_result_from_cache(self, image: Image) -> Optional[Tuple[Keypoints, np.ndarray]]:
+    def __load_result_from_cache(self, cache_path: Path) -> Optional[Tuple[Keypoints, np.ndarray]]:
         """Load cached result, if they exist."""
-        cache_path = self.__get_cache_path(cache_key=self.__generate_cache_key(image=image))
         cached_data = io_utils.read_from_bz2_file(cache_path)
         if cached_data is None:
             return None
         return cached_data["keypoints"], cached_data["descriptors"]
 
-    def __save_result_to_cache(self, image: Image, keypoints: Keypoints, descriptors: np.ndarray) -> None:
+    def __save_result_to_cache(self, cache_path: Path, keypoints: Keypoints, descriptors: np.ndarray) -> None:
         """Save the results to the cache."""
-        cache_path = self.__get_cache_path(cache_key=self.__generate_cache_key(image=image))
         data = {"keypoints": keypoints, "descriptors": descriptors}
         io_utils.write_to_bz2_file(data, cache_path)
 
@@ -84,12 +82,14 @@ class DetectorDescriptorCacher(DetectorDescriptorBase):
             Detected keypoints, with length N <= max_keypoints.
             Corr. descriptors, of shape (N, D) where D is the dimension of each descriptor.
         """
-        cached_data = self.__load_result_from_cache(image)
+        # The cache key is generated once, and used for both the lookup and the write on a cache miss.
+        cache_path = self.__get_cache_path(cache_key=self.__generate_cache_key(image=image))
+        cached_data = self.__load_result_from_cache(cache_path)
 
         if cached_data is not None:
             return cached_data
 
         keypoints, descriptors = self._detector_descriptor.detect_and_describe(image)
-        self.__save_result_to_cache(image, keypoints, descriptors)
+        self.__save_result_to_cache(cache_path, keypoints, descriptors)
 
         return keypoints, descriptors
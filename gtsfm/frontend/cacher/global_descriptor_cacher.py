@@ -46,17 +46,15 @@ class GlobalDescriptorCacher(GlobalDescriptorBase):
         input_key = cache_utils.generate_hash_for_image(image)
         return "{}_{}".format(self._global_descriptor_obj_cache_key, input_key)
 
-    def __load_result_from_cache(self, image: Image) -> Optional[np.ndarray]:
+    def __load_result_from_cache(self, cache_path: Path) -> Optional[np.ndarray]:
         """Load cached result, if they exist."""
-        cache_path = self.__get_cache_path(cache_key=self.__generate_cache_key(image=image))
         cached_data = io_utils.read_from_bz2_file(cache_path)
         if cached_data is None:
             return None
         return cached_data["global_descriptor"]
 
-    def __save_result_to_cache(self, image: Image, global_descriptor: np.ndarray) -> None:
+    def __save_result_to_cache(self, cache_path: Path, global_descriptor: np.ndarray) -> None:
         """Save the results to the cache."""
-        cache_path = self.__get_cache_path(cache_key=self.__generate_cache_key(image=image))
         data = {"global_descriptor": global_descriptor}
         io_utils.write_to_bz2_file(data, cache_path)
 
@@ -75,12 +73,14 @@ class GlobalDescriptorCacher(GlobalDescriptorBase):
         Returns:
             Global image descriptor, of shape (D,).
         """
-        cached_data = self.__load_result_from_cache(image)
+        # The cache key is generated once, and used for both the lookup and the write on a cache miss.
+        cache_path = self.__get_cache_path(cache_key=self.__generate_cache_key(image=image))
+        cached_data = self.__load_result_from_cache(cache_path)
 
         if cached_data is not None:
             return cached_data
 
         global_descriptor = self._global_descriptor.describe(image)
-        self.__save_result_to_cache(image, global_descriptor)
+        self.__save_result_to_cache(cache_path, global_descriptor)
 
         return global_descriptor
@@ -48,19 +48,15 @@ class ImageMatcherCacher(ImageMatcherBase):
 
         return "{}_{}_{}".format(self._matcher_obj_key, input_key_i1, input_key_i2)
 
-    def _load_result_from_cache(self, image_i1: Image, image_i2: Image) -> Optional[Tuple[Keypoints, Keypoints]]:
+    def _load_result_from_cache(self, cache_path: Path) -> Optional[Tuple[Keypoints, Keypoints]]:
         """Load cached result, if it exists. The cached result will be a 2D numpy array with 2 columns."""
-        cache_path = self._get_cache_path(cache_key=self._generate_cache_key(image_i1=image_i1, image_i2=image_i2))
         cached_data = io_utils.read_from_bz2_file(cache_path)
         if cached_data is None:
             return None
         return cached_data["keypoints_i1"], cached_data["keypoints_i2"]
 
-    def _save_result_to_cache(
-        self, image_i1: Image, image_i2: Image, keypoints_i1: Keypoints, keypoints_i2: Keypoints
-    ) -> None:
+    def _save_result_to_cache(self, cache_path: Path, keypoints_i1: Keypoints, keypoints_i2: Keypoints) -> None:
         """Save the results (corresponding keypoints) to the cache."""
-        cache_path = self._get_cache_path(cache_key=self._generate_cache_key(image_i1=image_i1, image_i2=image_i2))
         data = {"keypoints_i1": keypoints_i1, "keypoints_i2": keypoints_i2}
         io_utils.write_to_bz2_file(data, cache_path)
 
@@ -78,14 +74,14 @@ class ImageMatcherCacher(ImageMatcherBase):
             Keypoints from image 1 (N keypoints will exist).
             Corresponding keypoints from image 2 (there will also be N keypoints). These represent feature matches.
         """
-        cached_data = self._load_result_from_cache(image_i1=image_i1, image_i2=image_i2)
+        # The cache key is generated once, and used for both the lookup and the write on a cache miss.
+        cache_path = self._get_cache_path(cache_key=self._generate_cache_key(image_i1=image_i1, image_i2=image_i2))
+        cached_data = self._load_result_from_cache(cache_path)
 
         if cached_data is not None:
             return cached_data
 
         keypoints_i1, keypoints_i2 = self._matcher.match(image_i1=image_i1, image_i2=image_i2)
 
-        self._save_result_to_cache(
-            image_i1=image_i1, image_i2=image_i2, keypoints_i1=keypoints_i1, keypoints_i2=keypoints_i2
-        )
+        self._save_result_to_cache(cache_path=cache_path, keypoints_i1=keypoints_i1, keypoints_i2=keypoints_i2)
         return keypoints_i1, keypoints_i2
@@ -79,49 +79,12 @@ class MatcherCacher(MatcherBase):
 
         return "{}_{}".format(self._matcher_obj_key, input_key)
 
-    def __load_result_from_cache(
-        self,
-        keypoints_i1: Keypoints,
-        keypoints_i2: Keypoints,
-        descriptors_i1: np.ndarray,
-        descriptors_i2: np.ndarray,
-        im_shape_i1: Tuple[int, int, int],
-        im_shape_i2: Tuple[int, int, int],
-    ) -> Optional[np.ndarray]:
+    def __load_result_from_cache(self, cache_path: Path) -> Optional[np.ndarray]:
         """Load cached result, if it exists. The cached result will be a 2D numpy array with 2 columns."""
-        cache_path = self.__get_cache_path(
-            cache_key=self.__generate_cache_key(
-                keypoints_i1=keypoints_i1,
-                keypoints_i2=keypoints_i2,
-                descriptors_i1=descriptors_i1,
-                descriptors_i2=descriptors_i2,
-                im_shape_i1=im_shape_i1,
-                im_shape_i2=im_shape_i2,
-            )
-        )
         return io_utils.read_from_bz2_file(cache_path)
 
-    def __save_result_to_cache(
-        self,
-        keypoints_i1: Keypoints,
-        keypoints_i2: Keypoints,
-        descriptors_i1: np.ndarray,
-        descriptors_i2: np.ndarray,
-        im_shape_i1: Tuple[int, int],
-        im_shape_i2: Tuple[int, int],
-        match_indices: np.ndarray,
-    ) -> None:
+    def __save_result_to_cache(self, cache_path: Path, match_indices: np.ndarray) -> None:
         """Save the results (match indice) to the cache."""
-        cache_path = self.__get_cache_path(
-            cache_key=self.__generate_cache_key(
-                keypoints_i1=keypoints_i1,
-                keypoints_i2=keypoints_i2,
-                descriptors_i1=descriptors_i1,
-                descriptors_i2=descriptors_i2,
-                im_shape_i1=im_shape_i1,
-                im_shape_i2=im_shape_i2,
-            )
-        )
         io_utils.write_to_bz2_file(match_indices, cache_path)
 
     def match(
@@ -158,14 +121,18 @@ class MatcherCacher(MatcherBase):
         Returns:
             Match indices (sorted by confidence), as matrix of shape (N, 2), where N < min(N1, N2).
         """
-        cached_data = self.__load_result_from_cache(
-            keypoints_i1=keypoints_i1,
-            keypoints_i2=keypoints_i2,
-            descriptors_i1=descriptors_i1,
-            descriptors_i2=descriptors_i2,
-            im_shape_i1=im_shape_i1,
-            im_shape_i2=im_shape_i2,
+        # The cache key is generated once, and used for both the lookup and the write on a cache miss.
+        cache_path = self.__get_cache_path(
+            cache_key=self.__generate_cache_key(
+                keypoints_i1=keypoints_i1,
+                keypoints_i2=keypoints_i2,
+                descriptors_i1=descriptors_i1,
+                descriptors_i2=descriptors_i2,
+                im_shape_i1=im_shape_i1,
+                im_shape_i2=im_shape_i2,
+            )
         )
+        cached_data = self.__load_result_from_cache(cache_path)
 
         if cached_data is not None:
             return cached_data
@@ -179,14 +146,6 @@ class MatcherCacher(MatcherBase):
             im_shape_i2=im_shape_i2,
         )
 
-        self.__save_result_to_cache(
-            keypoints_i1=keypoints_i1,
-            keypoints_i2=keypoints_i2,
-            descriptors_i1=descriptors_i1,
-            descriptors_i2=descriptors_i2,
-            im_shape_i1=im_shape_i1,
-            im_shape_i2=im_shape_i2,
-            match_indices=match_indices,
-        )
+        self.__save_result_to_cache(cache_path=cache_path, match_indices=match_indices)
 
         return match_indices
@@ -63,7 +63,7 @@ class InlierSupportProcessor:
         failure_result = (
             None,
             None,
-            np.array([], dtype=np.uint64),
+            np.zeros((0, 2), dtype=np.uint32),
             TwoViewEstimationReport(v_corr_idxs=v_corr_idxs, num_inliers_est_model=0),
         )
 
@@ -80,7 +80,7 @@ class GricVerifier(VerifierBase):
         )
 
         # for failure, i2Ri1 = None, and i2Ui1 = None, and no verified correspondences, and inlier_ratio_est_model = 0
-        self._failure_result = (None, None, np.array([], dtype=np.uint64), 0.0)
+        self._failure_result = (None, None, np.zeros((0, 2), dtype=np.uint32), 0.0)
 
     def __estimate_two_view_geometry(
         self,
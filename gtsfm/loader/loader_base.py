@@ -5,7 +5,7 @@ Authors: Frank Dellaert and Ayush Baid
 
 import abc
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import dask
 from dask.delayed import Delayed
@@ -57,6 +57,10 @@ class LoaderBase(GTSFMProcess):
             raise ValueError("Maximum image resolution must be an integer argument.")
         self._max_resolution = max_resolution
         self._input_worker = input_worker
+        # Per-image metadata for the whole dataset, memoized by the name of the getter that computed it.
+        self._all_images_metadata_cache: Dict[str, List[Any]] = {}
+        # Downsampling factors (scale_u, scale_v) per image index, memoized as they are computed from the image on disk.
+        self._downsampling_factors_cache: Dict[int, Tuple[float, float]] = {}
 
     # ignored-abstractmethod
     @abc.abstractmethod
@@ -194,7 +198,7 @@ class LoaderBase(GTSFMProcess):
     ) -> gtsfm_types.CALIBRATION_TYPE:
         """Rescale the intrinsics to match the image resolution.
 
-        Reads the image from disk to determine the scaling factor.
+        Reads the image from disk to determine the scaling factor, the first time an image index is queried.
 
         Args:
             intrinsics_full_res: Intrinsics for the given camera at full resolution.
@@ -210,11 +214,14 @@ class LoaderBase(GTSFMProcess):
         if intrinsics_full_res.px() <= 0 or intrinsics_full_res.py() <= 0:
             raise RuntimeError("Principal point must have positive coordinates.")
 
-        img_full_res = self.get_image_full_res(image_index)
-        # no downsampling may be required, in which case scale_u and scale_v will be 1.0
-        scale_u, scale_v, _, _ = img_utils.get_downsampling_factor_per_axis(
-            img_full_res.height, img_full_res.width, self._max_resolution
-        )
+        if image_index not in self._downsampling_factors_cache:
+            img_full_res = self.get_image_full_res(image_index)
+            # no downsampling may be required, in which case scale_u and scale_v will be 1.0
+            scale_u, scale_v, _, _ = img_utils.get_downsampling_factor_per_axis(
+                img_full_res.height, img_full_res.width, self._max_resolution
+            )
+            self._downsampling_factors_cache[image_index] = (scale_u, scale_v)
+        scale_u, scale_v = self._downsampling_factors_cache[image_index]
         return Cal3Bundler(
             fx=intrinsics_full_res.fx() * scale_u,
             k1=0.0,
@@ -329,13 +336,16 @@ class LoaderBase(GTSFMProcess):
     def create_computation_graph_for_images(self) -> List[Delayed]:
         """Creates the computation graph for image fetches.
 
+        Image fetches are deterministic, so tasks are created with `pure=True` and repeated fetches of the same index
+        share a single task key in the graph.
+
         Returns:
             List of delayed tasks for images.
         """
         N = len(self)
         annotation = dask.annotate(workers=self._input_worker) if self._input_worker else dask.annotate()
         with annotation:
-            delayed_images = [dask.delayed(self.get_image)(i) for i in range(N)]
+            delayed_images = [dask.delayed(self.get_image, pure=True)(i) for i in range(N)]
         return delayed_images
 
     def get_all_images_as_futures(self, client: Client) -> List[Future]:
@@ -344,6 +354,22 @@ class LoaderBase(GTSFMProcess):
             for i in range(len(self))
         ]
 
+    def _get_for_all_images(self, getter: Callable[[int], Any]) -> List[Any]:
+        """Applies a per-image getter to all images, memoizing the result for subsequent calls.
+
+        Several getters read images from disk (e.g. to rescale intrinsics), so the results are computed only once.
+
+        Args:
+            getter: Bound method of this loader, taking the image index as its only argument.
+
+        Returns:
+            List with the getter's result for each image, as a new list that can be modified by the caller.
+        """
+        cache_key = getter.__name__
+        if cache_key not in self._all_images_metadata_cache:
+            self._all_images_metadata_cache[cache_key] = [getter(i) for i in range(len(self))]
+        return list(self._all_images_metadata_cache[cache_key])
+
     def get_all_intrinsics(self) -> List[Optional[gtsfm_types.CALIBRATION_TYPE]]:
         """Return all the camera intrinsics.
 
@@ -352,8 +378,7 @@ class LoaderBase(GTSFMProcess):
         Returns:
             List of camera intrinsics.
         """
-        N = len(self)
-        return [self.get_camera_intrinsics(i) for i in range(N)]
+        return self._get_for_all_images(self.get_camera_intrinsics)
 
     def get_gt_poses(self) -> List[Optional[Pose3]]:
         """Return all the camera poses.
@@ -361,8 +386,7 @@ class LoaderBase(GTSFMProcess):
         Returns:
             List of ground truth camera poses, if available.
         """
-        N = len(self)
-        return [self.get_camera_pose(i) for i in range(N)]
+        return self._get_for_all_images(self.get_camera_pose)
 
     def get_gt_cameras(self) -> List[Optional[gtsfm_types.CAMERA_TYPE]]:
         """Return all the cameras.
@@ -372,8 +396,7 @@ class LoaderBase(GTSFMProcess):
         Returns:
             List of ground truth cameras, if available.
         """
-        N = len(self)
-        return [self.get_camera(i) for i in range(N)]
+        return self._get_for_all_images(self.get_camera)
 
     def get_image_shapes(self) -> List[Tuple[int, int]]:
         """Return all the image shapes.
@@ -383,8 +406,7 @@ class LoaderBase(GTSFMProcess):
         Returns:
             List of delayed tasks for image shapes.
         """
-        N = len(self)
-        return [self.get_image_shape(i) for i in range(N)]
+        return self._get_for_all_images(self.get_image_shape)
 
     def get_valid_pairs(self) -> List[Tuple[int, int]]:
         """Get the valid pairs of images for this loader.
@@ -78,7 +78,7 @@ class MultiViewOptimizer:
             all_intrinsics: intrinsics for images.
             absolute_pose_priors: Priors on the camera poses.
             relative_pose_priors: Priors on the pose between camera pairs.
-            two_view_reports_dict: Dict of TwoViewEstimationReports from the front-end.
+            two_view_reports_dict: Dict of TwoViewEstimationReports from the front-end, optionally wrapped as Delayed.
             cameras_gt: List of GT cameras (if they exist), ordered by camera index.
             gt_wTi_list: List of GT poses of the camera.
             output_root: Path where output should be saved.
@@ -1,17 +1,19 @@
 """Base class for runner that executes SfM."""
 
 import argparse
+import contextlib
 import os
 import time
 from abc import abstractmethod, abstractproperty
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, ContextManager, Dict, List, Tuple
 
 import dask
 import hydra
 import numpy as np
 from dask import config as dask_config
-from dask.distributed import Client, LocalCluster, SSHCluster, performance_report
+from dask.distributed import Client, LocalCluster, SSHCluster, as_completed, performance_report
 from gtsam import Rot3, Unit3
 from hydra.utils import instantiate
 from omegaconf import OmegaConf
@@ -19,7 +21,6 @@ from omegaconf import OmegaConf
 import gtsfm.evaluation.metrics_report as metrics_report
 import gtsfm.utils.logger as logger_utils
 import gtsfm.utils.metrics as metrics_utils
-import gtsfm.utils.viz as viz_utils
 from gtsfm.common.gtsfm_data import GtsfmData
 from gtsfm import two_view_estimator
 from gtsfm.evaluation.metrics import GtsfmMetric, GtsfmMetricsGroup
@@ -68,7 +69,18 @@ class GtsfmRunnerBase:
             help="Number of threads per each worker.",
         )
         parser.add_argument(
-            "--worker_memory_limit", type=str, default="8GB", help="Memory limit per worker, e.g. `8GB`"
+            "--worker_memory_limit",
+            type=str,
+            default="8GB",
+            help="Memory limit per worker, e.g. `8GB`, or `auto` to split the system memory evenly among workers.",
+        )
+        parser.add_argument(
+            "--worker_type",
+            type=str,
+            default="auto",
+            choices=["auto", "processes", "threads"],
+            help="Whether local workers are separate processes or threads of a single process. `auto` uses threads"
+            " for image-matcher-based (deep) front-ends and processes otherwise.",
         )
         parser.add_argument(
             "--config_name",
@@ -144,6 +156,12 @@ class GtsfmRunnerBase:
             default=":8787",
             help="dask dashboard port number",
         )
+        parser.add_argument(
+            "--dask_performance_report",
+            action="store_true",
+            help="Save a Dask performance report (HTML) for each stage of the pipeline. Off by default, as rendering"
+            " the reports adds overhead.",
+        )
         parser.add_argument(
             "--num_retry_cluster_connection",
             type=int,
@@ -161,6 +179,9 @@ class GtsfmRunnerBase:
 
         All configs are relative to the gtsfm module.
         """
+        # A single Hydra context is used for the main config and all overrides; override configs are composed from
+        # their config group sub-directory instead of re-initializing Hydra for each one. Hydra nests a config
+        # composed this way under its group name, e.g. `correspondence/sift` yields `{correspondence: {...}}`.
         with hydra.initialize_config_module(config_module="gtsfm.configs"):
             overrides = ["+SceneOptimizer.output_root=" + str(self.parsed_args.output_root)]
             if self.parsed_args.share_intrinsics:
@@ -172,32 +193,31 @@ class GtsfmRunnerBase:
             )
             scene_optimizer: SceneOptimizer = instantiate(main_cfg.SceneOptimizer)
 
-        # Override correspondence generator.
-        if self.parsed_args.correspondence_generator_config_name is not None:
-            with hydra.initialize_config_module(config_module="gtsfm.configs.correspondence"):
+            # Override correspondence generator.
+            if self.parsed_args.correspondence_generator_config_name is not None:
                 correspondence_cfg = hydra.compose(
-                    config_name=self.parsed_args.correspondence_generator_config_name,
+                    config_name="correspondence/" + self.parsed_args.correspondence_generator_config_name,
                 )
                 logger.info("\n\nCorrespondenceGenerator override: " + OmegaConf.to_yaml(correspondence_cfg))
-                scene_optimizer.correspondence_generator = instantiate(correspondence_cfg.CorrespondenceGenerator)
+                scene_optimizer.correspondence_generator = instantiate(
+                    correspondence_cfg.correspondence.CorrespondenceGenerator
+                )
 
-        # Override verifier.
-        if self.parsed_args.verifier_config_name is not None:
-            with hydra.initialize_config_module(config_module="gtsfm.configs.verifier"):
+            # Override verifier.
+            if self.parsed_args.verifier_config_name is not None:
                 verifier_cfg = hydra.compose(
-                    config_name=self.parsed_args.verifier_config_name,
+                    config_name="verifier/" + self.parsed_args.verifier_config_name,
                 )
                 logger.info("\n\nVerifier override: " + OmegaConf.to_yaml(verifier_cfg))
-                scene_optimizer.two_view_estimator._verifier = instantiate(verifier_cfg.verifier)
+                scene_optimizer.two_view_estimator._verifier = instantiate(verifier_cfg.verifier.verifier)
 
-        # Override retriever.
-        if self.parsed_args.retriever_config_name is not None:
-            with hydra.initialize_config_module(config_module="gtsfm.configs.retriever"):
+            # Override retriever.
+            if self.parsed_args.retriever_config_name is not None:
                 retriever_cfg = hydra.compose(
-                    config_name=self.parsed_args.retriever_config_name,
+                    config_name="retriever/" + self.parsed_args.retriever_config_name,
                 )
                 logger.info("\n\nRetriever override: " + OmegaConf.to_yaml(retriever_cfg))
-                scene_optimizer.image_pairs_generator._retriever = instantiate(retriever_cfg.retriever)
+                scene_optimizer.image_pairs_generator._retriever = instantiate(retriever_cfg.retriever.retriever)
 
         if self.parsed_args.max_frame_lookahead is not None:
             if scene_optimizer.image_pairs_generator._retriever._matching_regime in [
@@ -243,7 +263,7 @@ class GtsfmRunnerBase:
 
     def setup_ssh_cluster_with_retries(self) -> SSHCluster:
         """Sets up SSH Cluster allowing multiple retries upon connection failures."""
-        workers = OmegaConf.load(os.path.join("gtsfm", "configs", self.parsed_args.cluster_config))["workers"]
+        workers = list(load_cluster_workers(os.path.join("gtsfm", "configs", self.parsed_args.cluster_config)))
         scheduler = workers[0]
         connected = False
         retry_count = 0
@@ -272,6 +292,30 @@ class GtsfmRunnerBase:
             )
         return cluster
 
+    def use_worker_processes(self) -> bool:
+        """Determines whether local Dask workers should be processes, rather than threads of a single process.
+
+        Deep image matchers spend most of their time in kernels that release the GIL and hold large models in memory,
+        so they are best served by threads sharing a single copy of the model. Other front-ends are dominated by
+        GIL-bound Python code and need separate processes to run in parallel.
+
+        Returns:
+            True if workers should be started as processes.
+        """
+        if self.parsed_args.worker_type == "auto":
+            return not isinstance(self.scene_optimizer.correspondence_generator, ImageCorrespondenceGenerator)
+        return self.parsed_args.worker_type == "processes"
+
+    def performance_report(self, filename: str) -> ContextManager:
+        """Returns a Dask performance report context for a pipeline stage, or a no-op context if reports are disabled.
+
+        Args:
+            filename: File name for the HTML report of the stage.
+        """
+        if self.parsed_args.dask_performance_report:
+            return performance_report(filename=filename)
+        return contextlib.nullcontext()
+
     def run(self) -> GtsfmData:
         """Run the SceneOptimizer."""
         start_time = time.time()
@@ -288,7 +332,8 @@ class GtsfmRunnerBase:
             local_cluster_kwargs = {
                 "n_workers": self.parsed_args.num_workers,
                 "threads_per_worker": self.parsed_args.threads_per_worker,
-                "dashboard_address": self.parsed_args.dashboard_port
+                "processes": self.use_worker_processes(),
+                "dashboard_address": self.parsed_args.dashboard_port,
             }
             if self.parsed_args.worker_memory_limit is not None:
                 local_cluster_kwargs["memory_limit"] = self.parsed_args.worker_memory_limit
@@ -301,11 +346,15 @@ class GtsfmRunnerBase:
             process_graph_generator.is_image_correspondence = True
         process_graph_generator.save_graph()
 
+        # Images are loaded on the workers once and the futures are shared by the retriever, the front-end and the
+        # back-end graph, so decoded images never need to be co-resident on the client.
+        image_futures = self.loader.get_all_images_as_futures(client)
+
         retriever_start_time = time.time()
-        with performance_report(filename="retriever-dask-report.html"):
+        with self.performance_report(filename="retriever-dask-report.html"):
             image_pair_indices = self.scene_optimizer.image_pairs_generator.generate_image_pairs(
                 client=client,
-                images=self.loader.get_all_images_as_futures(client),
+                images=image_futures,
                 image_fnames=self.loader.image_filenames(),
                 plots_output_dir=self.scene_optimizer._plot_base_path,
             )
@@ -317,16 +366,20 @@ class GtsfmRunnerBase:
         retriever_metrics.add_metric(GtsfmMetric("retriever_duration_sec", retriever_duration_sec))
         logger.info("Image pair retrieval took %.2f sec.", retriever_duration_sec)
 
+        # Fetch loader outputs once; they are reused by both the front-end and the back-end graph.
         intrinsics = self.loader.get_all_intrinsics()
+        relative_pose_priors = self.loader.get_relative_pose_priors(image_pair_indices)
+        cameras_gt = self.loader.get_gt_cameras()
+        gt_scene_mesh = self.loader.get_gt_scene_trimesh()
 
-        with performance_report(filename="correspondence-generator-dask-report.html"):
+        with self.performance_report(filename="correspondence-generator-dask-report.html"):
             correspondence_generation_start_time = time.time()
             (
                 keypoints_list,
                 putative_corr_idxs_dict,
             ) = self.scene_optimizer.correspondence_generator.generate_correspondences(
                 client,
-                self.loader.get_all_images_as_futures(client),
+                image_futures,
                 image_pair_indices,
             )
             correspondence_generation_duration_sec = time.time() - correspondence_generation_start_time
@@ -338,31 +391,20 @@ class GtsfmRunnerBase:
                 keypoints_list,
                 putative_corr_idxs_dict,
                 intrinsics,
-                self.loader.get_relative_pose_priors(image_pair_indices),
-                self.loader.get_gt_cameras(),
-                gt_scene_mesh=self.loader.get_gt_scene_trimesh(),
+                relative_pose_priors,
+                cameras_gt,
+                gt_scene_mesh=gt_scene_mesh,
+                images=image_futures,
+                correspondences_viz_dir=(
+                    str(self.scene_optimizer._plot_correspondence_path)
+                    if self.scene_optimizer._save_two_view_correspondences_viz
+                    else None
+                ),
             )
             two_view_estimation_duration_sec = time.time() - two_view_estimation_start_time
 
         i2Ri1_dict, i2Ui1_dict, v_corr_idxs_dict, two_view_reports_dict = unzip_two_view_results(two_view_results_dict)
 
-        if self.scene_optimizer._save_two_view_correspondences_viz:
-            for i1, i2 in v_corr_idxs_dict.keys():
-                image_i1 = self.loader.get_image(i1)
-                image_i2 = self.loader.get_image(i2)
-                viz_utils.save_twoview_correspondences_viz(
-                    image_i1,
-                    image_i2,
-                    keypoints_list[i1],
-                    keypoints_list[i2],
-                    v_corr_idxs_dict[(i1, i2)],
-                    two_view_report=two_view_reports_dict[(i1, i2)],
-                    file_path=os.path.join(
-                        self.scene_optimizer._plot_correspondence_path,
-                        f"{i1}_{i2}__{image_i1.file_name}_{image_i2.file_name}.jpg",
-                    ),
-                )
-
         two_view_agg_metrics = two_view_estimator.aggregate_frontend_metrics(
             two_view_reports_dict=two_view_reports_dict,
             angular_err_threshold_deg=self.scene_optimizer._pose_angular_error_thresh,
@@ -383,17 +425,21 @@ class GtsfmRunnerBase:
             v_corr_idxs_dict=v_corr_idxs_dict,
             two_view_reports=two_view_reports_dict,
             num_images=len(self.loader),
-            images=self.loader.create_computation_graph_for_images(),
+            images=image_futures,
             camera_intrinsics=intrinsics,
-            relative_pose_priors=self.loader.get_relative_pose_priors(image_pair_indices),
+            relative_pose_priors=relative_pose_priors,
             absolute_pose_priors=self.loader.get_absolute_pose_priors(),
-            cameras_gt=self.loader.get_gt_cameras(),
+            cameras_gt=cameras_gt,
             gt_wTi_list=self.loader.get_gt_poses(),
-            gt_scene_mesh=self.loader.get_gt_scene_trimesh(),
+            gt_scene_mesh=gt_scene_mesh,
         )
 
-        with performance_report(filename="scene-optimizer-dask-report.html"):
-            sfm_result, *other_results = dask.compute(delayed_sfm_result, *delayed_io, *delayed_mvo_metrics_groups)
+        with self.performance_report(filename="scene-optimizer-dask-report.html"):
+            # Submit everything at once so that I/O tasks are written out as they finish, overlapping with the
+            # remainder of the back-end, instead of blocking on the whole graph.
+            futures = client.compute([delayed_sfm_result, *delayed_io, *delayed_mvo_metrics_groups])
+            results_by_key = {future.key: result for future, result in as_completed(futures, with_results=True)}
+            sfm_result, *other_results = [results_by_key[future.key] for future in futures]
         mvo_metrics_groups = [x for x in other_results if isinstance(x, GtsfmMetricsGroup)]
 
         assert isinstance(sfm_result, GtsfmData)
@@ -412,6 +458,19 @@ class GtsfmRunnerBase:
         return sfm_result
 
 
+@lru_cache(maxsize=8)
+def load_cluster_workers(cluster_config_fpath: str) -> Tuple[str, ...]:
+    """Loads the worker addresses listed in a cluster config, reading each config from disk only once per process.
+
+    Args:
+        cluster_config_fpath: Path to the cluster config YAML file.
+
+    Returns:
+        Addresses of the workers, the first of which is used as the scheduler.
+    """
+    return tuple(OmegaConf.load(cluster_config_fpath)["workers"])
+
+
 def unzip_two_view_results(
     two_view_results: Dict[Tuple[int, int], TWO_VIEW_OUTPUT]
 ) -> Tuple[
@@ -421,21 +480,19 @@ def unzip_two_view_results(
     Dict[Tuple[int, int], TwoViewEstimationReport],
 ]:
     """Unzip the tuple TWO_VIEW_OUTPUT into 1 dictionary for 1 element in the tuple."""
-    i2Ri1_dict: Dict[Tuple[int, int], Rot3] = {}
-    i2Ui1_dict: Dict[Tuple[int, int], Unit3] = {}
-    v_corr_idxs_dict: Dict[Tuple[int, int], np.ndarray] = {}
-    two_view_reports_dict: Dict[Tuple[int, int], TwoViewEstimationReport] = {}
-
-    for (i1, i2), two_view_output in two_view_results.items():
-        i2Ri1 = two_view_output[0]
-        i2Ui1 = two_view_output[1]
-        if i2Ri1 is None or i2Ui1 is None:
-            continue
-
-        i2Ri1_dict[(i1, i2)] = i2Ri1
-        i2Ui1_dict[(i1, i2)] = i2Ui1
-        v_corr_idxs_dict[(i1, i2)] = two_view_output[2]
-        two_view_reports_dict[(i1, i2)] = two_view_output[5]
+    # Filter out failed pairs once, then build each dictionary in a single pass.
+    valid_results = [
+        (pair, two_view_output)
+        for pair, two_view_output in two_view_results.items()
+        if two_view_output[0] is not None and two_view_output[1] is not None
+    ]
+
+    i2Ri1_dict: Dict[Tuple[int, int], Rot3] = {pair: output[0] for pair, output in valid_results}
+    i2Ui1_dict: Dict[Tuple[int, int], Unit3] = {pair: output[1] for pair, output in valid_results}
+    v_corr_idxs_dict: Dict[Tuple[int, int], np.ndarray] = {pair: output[2] for pair, output in valid_results}
+    two_view_reports_dict: Dict[Tuple[int, int], TwoViewEstimationReport] = {
+        pair: output[5] for pair, output in valid_results
+    }
 
     return i2Ri1_dict, i2Ui1_dict, v_corr_idxs_dict, two_view_reports_dict
 
@@ -449,8 +506,7 @@ def save_metrics_reports(metrics_group_list: List[GtsfmMetricsGroup], metrics_pa
     """
 
     # Save metrics to JSON
-    metrics_utils.save_metrics_as_json(metrics_group_list, metrics_path)
-    metrics_utils.save_metrics_as_json(metrics_group_list, str(REACT_METRICS_PATH))
+    metrics_utils.save_metrics_as_json(metrics_group_list, [metrics_path, str(REACT_METRICS_PATH)])
 
     metrics_report.generate_metrics_report_html(
         metrics_group_list, os.path.join(metrics_path, "gtsfm_metrics_report.html"), None
@@ -6,14 +6,16 @@ import logging
 import os
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import ContextManager, Dict, List, Optional, Tuple, Union
 
 import dask
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 from dask.delayed import Delayed
+from dask.distributed import Future
 from gtsam import Pose3, Similarity3, Rot3, Unit3
 from trimesh import Trimesh
 
@@ -126,6 +128,16 @@ class SceneOptimizer:
         os.makedirs(REACT_RESULTS_PATH, exist_ok=True)
         os.makedirs(REACT_METRICS_PATH, exist_ok=True)
 
+    def _io_annotation(self) -> ContextManager:
+        """Annotation for tasks that write results to disk.
+
+        I/O tasks are pinned to the output worker (if any) and given a lower priority than the tasks on the critical
+        path of the SfM result, so that writers do not hold worker slots ahead of the back-end.
+        """
+        if self._output_worker:
+            return dask.annotate(workers=self._output_worker, priority=-1)
+        return dask.annotate(priority=-1)
+
     def create_computation_graph(
         self,
         keypoints_list: List[Keypoints],
@@ -134,7 +146,7 @@ class SceneOptimizer:
         v_corr_idxs_dict: Dict[Tuple[int, int], np.ndarray],
         two_view_reports: Dict[Tuple[int, int], TwoViewEstimationReport],
         num_images: int,
-        images: List[Delayed],
+        images: List[Union[Delayed, Future]],
         camera_intrinsics: List[Optional[gtsfm_types.CALIBRATION_TYPE]],
         absolute_pose_priors: List[Optional[PosePrior]],
         relative_pose_priors: Dict[Tuple[int, int], PosePrior],
@@ -147,6 +159,16 @@ class SceneOptimizer:
 
         delayed_results: List[Delayed] = []
 
+        # Embed the front-end reports and the per-image metadata in the graph as a single node each, so they are
+        # serialized once rather than once for every task that consumes them.
+        two_view_reports_graph = dask.delayed(two_view_reports, traverse=False)
+        keypoints_graph = dask.delayed(keypoints_list, traverse=False)
+        camera_intrinsics_graph = dask.delayed(camera_intrinsics, traverse=False)
+        absolute_pose_priors_graph = dask.delayed(absolute_pose_priors, traverse=False)
+        relative_pose_priors_graph = dask.delayed(relative_pose_priors, traverse=False)
+        cameras_gt_graph = dask.delayed(cameras_gt, traverse=False)
+        gt_wTi_list_graph = dask.delayed(gt_wTi_list, traverse=False)
+
         # Note: the MultiviewOptimizer returns BA input and BA output that are aligned to GT via Sim(3).
         (
             ba_input_graph,
@@ -156,16 +178,16 @@ class SceneOptimizer:
         ) = self.multiview_optimizer.create_computation_graph(
             images=images,
             num_images=num_images,
-            keypoints_list=keypoints_list,
+            keypoints_list=keypoints_graph,
             i2Ri1_dict=i2Ri1_dict,
             i2Ui1_dict=i2Ui1_dict,
             v_corr_idxs_dict=v_corr_idxs_dict,
-            all_intrinsics=camera_intrinsics,
-            absolute_pose_priors=absolute_pose_priors,
-            relative_pose_priors=relative_pose_priors,
-            two_view_reports_dict=two_view_reports,
-            cameras_gt=cameras_gt,
-            gt_wTi_list=gt_wTi_list,
+            all_intrinsics=camera_intrinsics_graph,
+            absolute_pose_priors=absolute_pose_priors_graph,
+            relative_pose_priors=relative_pose_priors_graph,
+            two_view_reports_dict=two_view_reports_graph,
+            cameras_gt=cameras_gt_graph,
+            gt_wTi_list=gt_wTi_list_graph,
             output_root=self.output_root,
         )
         if view_graph_two_view_reports is not None:
@@ -178,32 +200,22 @@ class SceneOptimizer:
             ImageMatchingRegime.RETRIEVAL,
             ImageMatchingRegime.SEQUENTIAL_WITH_RETRIEVAL,
         ]
-        annotation = dask.annotate(workers=self._output_worker) if self._output_worker else dask.annotate()
-        with annotation:
-            delayed_results.append(
-                dask.delayed(save_full_frontend_metrics)(
-                    two_view_reports,
-                    images,
-                    filename="two_view_report_{}.json".format(POST_ISP_REPORT_TAG),
-                    save_retrieval_metrics=save_retrieval_metrics,
-                    metrics_path=self._metrics_path,
-                    plot_base_path=self._plot_base_path,
-                )
-            )
-
+        with self._io_annotation():
             # TODO(Ayush): pass only image name instead of the whole image. And delete images from memory.
             delayed_results.append(
-                dask.delayed(save_full_frontend_metrics)(
-                    two_view_reports_post_viewgraph_estimator,
+                dask.delayed(save_all_frontend_metrics, pure=True)(
+                    {
+                        POST_ISP_REPORT_TAG: two_view_reports_graph,
+                        VIEWGRAPH_REPORT_TAG: two_view_reports_post_viewgraph_estimator,
+                    },
                     images,
-                    filename="two_view_report_{}.json".format(VIEWGRAPH_REPORT_TAG),
                     save_retrieval_metrics=save_retrieval_metrics,
                     metrics_path=self._metrics_path,
                     plot_base_path=self._plot_base_path,
                 )
             )
             metrics_graph_list.append(
-                dask.delayed(two_view_estimator.aggregate_frontend_metrics)(
+                dask.delayed(two_view_estimator.aggregate_frontend_metrics, pure=True)(
                     two_view_reports_post_viewgraph_estimator,
                     self._pose_angular_error_thresh,
                     metric_group_name="verifier_summary_{}".format(VIEWGRAPH_REPORT_TAG),
@@ -215,20 +227,19 @@ class SceneOptimizer:
             metrics_graph_list.extend(optimizer_metrics_graph)
 
         # Modify BA input, BA output, and GT poses to have point clouds and frustums aligned with x,y,z axes.
-        ba_input_graph, ba_output_graph, gt_wTi_list = dask.delayed(align_estimated_gtsfm_data, nout=3)(
-            ba_input_graph, ba_output_graph, gt_wTi_list
-        )
+        ba_input_graph, ba_output_graph, gt_wTi_list_graph = dask.delayed(
+            align_estimated_gtsfm_data, nout=3, pure=True
+        )(ba_input_graph, ba_output_graph, gt_wTi_list_graph)
 
-        annotation = dask.annotate(workers=self._output_worker) if self._output_worker else dask.annotate()
-        with annotation:
+        with self._io_annotation():
             if self._save_gtsfm_data:
                 delayed_results.append(
-                    dask.delayed(save_gtsfm_data)(
+                    dask.delayed(save_gtsfm_data, pure=True)(
                         images,
                         ba_input_graph,
                         ba_output_graph,
                         results_path=self._results_path,
-                        cameras_gt=cameras_gt,
+                        cameras_gt=cameras_gt_graph,
                     )
                 )
                 if self._save_3d_viz:
@@ -236,14 +247,14 @@ class SceneOptimizer:
                         save_matplotlib_visualizations(
                             aligned_ba_input_graph=ba_input_graph,
                             aligned_ba_output_graph=ba_output_graph,
-                            gt_pose_graph=gt_wTi_list,
+                            gt_pose_graph=gt_wTi_list_graph,
                             plot_ba_input_path=self._plot_ba_input_path,
                             plot_results_path=self._plot_results_path,
                         )
                     )
 
         if self.run_dense_optimizer and self.dense_multiview_optimizer is not None:
-            img_dict_graph = dask.delayed(get_image_dictionary)(images)
+            img_dict_graph = dask.delayed(get_image_dictionary, pure=True)(images)
             (
                 dense_points_graph,
                 dense_point_colors_graph,
@@ -252,10 +263,9 @@ class SceneOptimizer:
             ) = self.dense_multiview_optimizer.create_computation_graph(img_dict_graph, ba_output_graph)
 
             # Cast to string as Open3d cannot use PosixPath's for I/O -- only string file paths are accepted.
-            annotation = dask.annotate(workers=self._output_worker) if self._output_worker else dask.annotate()
-            with annotation:
+            with self._io_annotation():
                 delayed_results.append(
-                    dask.delayed(io_utils.save_point_cloud_as_ply)(
+                    dask.delayed(io_utils.save_point_cloud_as_ply, pure=True)(
                         save_fpath=str(self._mvs_ply_save_fpath),
                         points=dense_points_graph,
                         rgb=dense_point_colors_graph,
@@ -268,17 +278,13 @@ class SceneOptimizer:
             if downsampling_metrics_graph is not None:
                 metrics_graph_list.append(downsampling_metrics_graph)
 
-        # Save metrics to JSON and generate HTML report.
-        annotation = dask.annotate(workers=self._output_worker) if self._output_worker else dask.annotate()
-
         # return the entry with just the sfm result
         return ba_output_graph, delayed_results, metrics_graph_list
 
 
 def get_image_dictionary(image_list: List[Image]) -> Dict[int, Image]:
     """Convert a list of images to the MVS input format."""
-    img_dict = {i: img for i, img in enumerate(image_list)}
-    return img_dict
+    return dict(enumerate(image_list))
 
 
 def align_estimated_gtsfm_data(
@@ -331,10 +337,14 @@ def save_matplotlib_visualizations(
         A list of Delayed objects after saving the different visualizations.
     """
     viz_graph_list = []
-    viz_graph_list.append(dask.delayed(viz_utils.save_sfm_data_viz)(aligned_ba_input_graph, plot_ba_input_path))
-    viz_graph_list.append(dask.delayed(viz_utils.save_sfm_data_viz)(aligned_ba_output_graph, plot_results_path))
     viz_graph_list.append(
-        dask.delayed(viz_utils.save_camera_poses_viz)(
+        dask.delayed(viz_utils.save_sfm_data_viz, pure=True)(aligned_ba_input_graph, plot_ba_input_path)
+    )
+    viz_graph_list.append(
+        dask.delayed(viz_utils.save_sfm_data_viz, pure=True)(aligned_ba_output_graph, plot_results_path)
+    )
+    viz_graph_list.append(
+        dask.delayed(viz_utils.save_camera_poses_viz, pure=True)(
             aligned_ba_input_graph, aligned_ba_output_graph, gt_pose_graph, plot_results_path
         )
     )
@@ -381,29 +391,26 @@ def save_gtsfm_data(
     start_time = time.time()
 
     output_dir = results_path
-    # Save the input to Bundle Adjustment (from data association).
-    io_utils.export_model_as_colmap_text(
-        gtsfm_data=ba_input_data,
-        images=images,
-        save_dir=os.path.join(output_dir, "ba_input"),
-    )
-
-    # Save the output of Bundle Adjustment.
-    io_utils.export_model_as_colmap_text(
-        gtsfm_data=ba_output_data,
-        images=images,
-        save_dir=os.path.join(output_dir, "ba_output"),
-    )
 
     # Save the ground truth in the same format, for visualization.
     # We use the estimated tracks here, with ground truth camera poses.
     gt_gtsfm_data = get_gtsfm_data_with_gt_cameras_and_est_tracks(cameras_gt, ba_output_data)
 
-    io_utils.export_model_as_colmap_text(
-        gtsfm_data=gt_gtsfm_data,
-        images=images,
-        save_dir=os.path.join(output_dir, "ba_output_gt"),
-    )
+    # Save the input to Bundle Adjustment (from data association), the output of Bundle Adjustment, and the ground
+    # truth. The exports are independent and I/O-bound, so they are written concurrently.
+    models_to_export = {"ba_input": ba_input_data, "ba_output": ba_output_data, "ba_output_gt": gt_gtsfm_data}
+    with ThreadPoolExecutor(max_workers=len(models_to_export)) as executor:
+        export_futures = [
+            executor.submit(
+                io_utils.export_model_as_colmap_text,
+                gtsfm_data=gtsfm_data,
+                images=images,
+                save_dir=os.path.join(output_dir, dirname),
+            )
+            for dirname, gtsfm_data in models_to_export.items()
+        ]
+        for export_future in export_futures:
+            export_future.result()
 
     # Delete old version of React results directory.
     shutil.rmtree(REACT_RESULTS_PATH)
@@ -435,10 +442,10 @@ def save_full_frontend_metrics(
     """
     metrics_list = two_view_estimator.get_two_view_reports_summary(two_view_report_dict, images)
 
-    io_utils.save_json_file(os.path.join(metrics_path, filename), metrics_list)
-
-    # Save duplicate copy of 'frontend_full.json' within React Folder.
-    io_utils.save_json_file(os.path.join(REACT_METRICS_PATH, filename), metrics_list)
+    # Save duplicate copy of 'frontend_full.json' within React Folder, serializing the metrics only once.
+    io_utils.save_json_files(
+        [os.path.join(metrics_path, filename), os.path.join(REACT_METRICS_PATH, filename)], metrics_list
+    )
 
     # All retreival metrics need GT, no need to save them if GT is not available.
     gt_available = any([report.R_error_deg is not None for report in two_view_report_dict.values()])
@@ -448,6 +455,33 @@ def save_full_frontend_metrics(
         _save_retrieval_two_view_metrics(metrics_path, plot_base_path)
 
 
+def save_all_frontend_metrics(
+    two_view_report_dicts: Dict[str, Dict[Tuple[int, int], TwoViewEstimationReport]],
+    images: List[Image],
+    metrics_path: Path,
+    plot_base_path: Path,
+    save_retrieval_metrics: bool = True,
+) -> None:
+    """Saves the front-end metrics for several stages of the pipeline, within a single task.
+
+    Args:
+        two_view_report_dicts: Front-end metrics for pairs of images, keyed by the tag of the pipeline stage.
+        images: List of all images for this scene, in order of image/frame index.
+        metrics_path: Path to directory where metrics will be saved.
+        plot_base_path: Path to directory where plots will be saved.
+        save_retrieval_metrics: Whether to save retrieval metrics, when GT is available.
+    """
+    for tag, two_view_report_dict in two_view_report_dicts.items():
+        save_full_frontend_metrics(
+            two_view_report_dict,
+            images,
+            filename="two_view_report_{}.json".format(tag),
+            metrics_path=metrics_path,
+            plot_base_path=plot_base_path,
+            save_retrieval_metrics=save_retrieval_metrics,
+        )
+
+
 def _save_retrieval_two_view_metrics(metrics_path: Path, plot_base_path: Path) -> None:
     """Compare 2-view similarity scores with their 2-view pose errors after viewgraph estimation."""
     sim_fpath = plot_base_path / "netvlad_similarity_matrix.txt"
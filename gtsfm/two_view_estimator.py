@@ -3,11 +3,11 @@
 Authors: Ayush Baid, John Lambert
 """
 import dataclasses
-import logging
+import os
 import timeit
 from typing import Any, Dict, List, Optional, Tuple
 
-from dask.distributed import Client
+from dask.distributed import Client, Future
 import numpy as np
 from gtsam import PinholeCameraCal3Bundler, Pose3, Rot3, SfmTrack, Unit3
 
@@ -15,6 +15,7 @@ import gtsfm.common.types as gtsfm_types
 import gtsfm.utils.geometry_comparisons as comp_utils
 import gtsfm.utils.logger as logger_utils
 import gtsfm.utils.metrics as metric_utils
+import gtsfm.utils.viz as viz_utils
 from gtsfm.bundle.two_view_ba import TwoViewBundleAdjustment
 from gtsfm.common.gtsfm_data import GtsfmData
 from gtsfm.common.image import Image
@@ -29,17 +30,14 @@ from gtsfm.frontend.verifier.verifier_base import VerifierBase
 
 logger = logger_utils.get_logger()
 
-mpl_logger = logging.getLogger("matplotlib")
-mpl_logger.setLevel(logging.WARNING)
-
-pil_logger = logging.getLogger("PIL")
-pil_logger.setLevel(logging.INFO)
-
 PRE_BA_REPORT_TAG = "PRE_BA_2VIEW_REPORT"
 POST_BA_REPORT_TAG = "POST_BA_2VIEW_REPORT"
 POST_ISP_REPORT_TAG = "POST_INLIER_SUPPORT_PROCESSOR_2VIEW_REPORT"
 VIEWGRAPH_REPORT_TAG = "VIEWGRAPH_2VIEW_REPORT"
 
+# Number of batches of image pairs to create per worker thread when running the two-view estimator as futures.
+NUM_TWO_VIEW_BATCHES_PER_THREAD = 4
+
 TWO_VIEW_OUTPUT = Tuple[
     Optional[Rot3],
     Optional[Unit3],
@@ -351,6 +349,23 @@ class TwoViewEstimator:
         return post_isp_i2Ri1, post_isp_i2Ui1, post_isp_v_corr_idxs, pre_ba_report, post_ba_report, post_isp_report
 
 
+def _masked_nanmean(values: np.ndarray, mask: np.ndarray) -> float:
+    """Mean of the non-NaN entries of `values` selected by `mask`, without materializing the masked subset.
+
+    Args:
+        values: Array of shape (N,).
+        mask: Boolean array of shape (N,).
+
+    Returns:
+        Mean of the selected non-NaN values, or NaN if there are none.
+    """
+    valid = np.logical_and(mask, ~np.isnan(values))
+    num_valid = np.count_nonzero(valid)
+    if num_valid == 0:
+        return np.nan
+    return float(np.sum(values, where=valid) / num_valid)
+
+
 def generate_two_view_report(
     inlier_ratio_est_model: float,
     v_corr_idxs: np.ndarray,
@@ -363,12 +378,10 @@ def generate_two_view_report(
     # Compute ground truth metrics.
     if v_corr_idxs_inlier_mask_gt is not None and reproj_error_gt_model is not None:
         num_inliers_gt_model = np.count_nonzero(v_corr_idxs_inlier_mask_gt)
-        inlier_ratio_gt_model = (
-            np.count_nonzero(v_corr_idxs_inlier_mask_gt) / v_corr_idxs.shape[0] if len(v_corr_idxs) > 0 else 0.0
-        )
-        inlier_avg_reproj_error_gt_model = np.mean(reproj_error_gt_model[v_corr_idxs_inlier_mask_gt])
-        outlier_avg_reproj_error_gt_model = np.nanmean(
-            reproj_error_gt_model[np.logical_not(v_corr_idxs_inlier_mask_gt)]
+        inlier_ratio_gt_model = num_inliers_gt_model / v_corr_idxs.shape[0] if len(v_corr_idxs) > 0 else 0.0
+        inlier_avg_reproj_error_gt_model = _masked_nanmean(reproj_error_gt_model, v_corr_idxs_inlier_mask_gt)
+        outlier_avg_reproj_error_gt_model = _masked_nanmean(
+            reproj_error_gt_model, np.logical_not(v_corr_idxs_inlier_mask_gt)
         )
     else:
         num_inliers_gt_model = 0
@@ -442,43 +455,41 @@ def aggregate_frontend_metrics(
     """
     num_image_pairs = len(two_view_reports_dict.keys())
 
-    # All rotational errors in degrees.
-    rot3_angular_errors_list: List[float] = []
-    trans_angular_errors_list: List[float] = []
-
     inlier_ratio_gt_model_all_pairs = []
     inlier_ratio_est_model_all_pairs = []
     num_inliers_gt_model_all_pairs = []
     num_inliers_est_model_all_pairs = []
+    # Rotation error, translation error and inlier ratio w.r.t. GT model for each pair, with None stored as NaN.
+    errors_array = np.full((num_image_pairs, 3), np.nan)
     # Populate the distributions.
-    for report in two_view_reports_dict.values():
-        if report.R_error_deg is not None:
-            rot3_angular_errors_list.append(report.R_error_deg)
-        if report.U_error_deg is not None:
-            trans_angular_errors_list.append(report.U_error_deg)
-
+    for pair_idx, report in enumerate(two_view_reports_dict.values()):
+        for col_idx, value in enumerate((report.R_error_deg, report.U_error_deg, report.inlier_ratio_gt_model)):
+            if value is not None:
+                errors_array[pair_idx, col_idx] = value
         inlier_ratio_gt_model_all_pairs.append(report.inlier_ratio_gt_model)
         inlier_ratio_est_model_all_pairs.append(report.inlier_ratio_est_model)
         num_inliers_gt_model_all_pairs.append(report.num_inliers_gt_model)
         num_inliers_est_model_all_pairs.append(report.num_inliers_est_model)
 
-    rot3_angular_errors = np.array(rot3_angular_errors_list, dtype=float)
-    trans_angular_errors = np.array(trans_angular_errors_list, dtype=float)
+    is_valid_rot3 = ~np.isnan(errors_array[:, 0])
+    is_valid_unit3 = ~np.isnan(errors_array[:, 1])
+
+    # All angular errors in degrees, for pairs where they are available.
+    rot3_angular_errors = errors_array[is_valid_rot3, 0]
+    trans_angular_errors = errors_array[is_valid_unit3, 1]
     # Count number of rot3 errors which are not None. Should be same in rot3/unit3.
-    num_valid_image_pairs = np.count_nonzero(~np.isnan(rot3_angular_errors))
+    num_valid_image_pairs = np.count_nonzero(is_valid_rot3)
 
     # Compute pose errors by picking the max error from rot3 and unit3 errors.
-    pose_errors = np.maximum(rot3_angular_errors, trans_angular_errors)
+    pose_errors = np.maximum(errors_array[:, 0], errors_array[:, 1])[is_valid_rot3 & is_valid_unit3]
 
     # Check errors against the threshold.
-    success_count_rot3 = np.sum(rot3_angular_errors < angular_err_threshold_deg)
-    success_count_unit3 = np.sum(trans_angular_errors < angular_err_threshold_deg)
-    success_count_pose = np.sum(pose_errors < angular_err_threshold_deg)
+    success_count_rot3 = np.count_nonzero(rot3_angular_errors < angular_err_threshold_deg)
+    success_count_unit3 = np.count_nonzero(trans_angular_errors < angular_err_threshold_deg)
+    success_count_pose = np.count_nonzero(pose_errors < angular_err_threshold_deg)
 
     # Count image pair entries where inlier ratio w.r.t. GT model == 1.
-    all_correct = np.count_nonzero(
-        [report.inlier_ratio_gt_model == 1.0 for report in two_view_reports_dict.values() if report is not None]
-    )
+    all_correct = np.count_nonzero(errors_array[:, 2] == 1.0)
 
     logger.debug(
         "[Two view optimizer] [Summary] Rotation success: %d/%d/%d",
@@ -537,56 +548,140 @@ def run_two_view_estimator_as_futures(
     relative_pose_priors: Dict[Tuple[int, int], PosePrior],
     gt_cameras: List[Optional[gtsfm_types.CAMERA_TYPE]],
     gt_scene_mesh: Optional[Any],
+    batch_size: Optional[int] = None,
+    images: Optional[List[Future]] = None,
+    correspondences_viz_dir: Optional[str] = None,
 ) -> Dict[Tuple[int, int], TWO_VIEW_OUTPUT]:
-    """Run two-view estimator for all image pairs."""
+    """Run two-view estimator for all image pairs.
+
+    Image pairs are grouped into batches, and each batch is processed by a single task, to amortize the scheduler
+    overhead of submitting one tiny task per image pair.
+
+    Args:
+        client: Dask client, used to execute the two-view estimation as futures.
+        two_view_estimator: Two-view estimator to apply on each image pair.
+        keypoints_list: Keypoints for each image.
+        putative_corr_idxs_dict: Putative correspondence indices, for each image pair.
+        camera_intrinsics: Intrinsics for each image.
+        relative_pose_priors: Priors on the relative pose, for image pairs which have one.
+        gt_cameras: GT cameras for each image, used to evaluate metrics.
+        gt_scene_mesh: GT mesh of the 3D scene, used to evaluate metrics.
+        batch_size (optional): Number of image pairs per task. If None, it is chosen such that each worker thread
+            receives a few batches.
+        images (optional): All images, as futures. Only needed to visualize the correspondences.
+        correspondences_viz_dir (optional): If provided along with `images`, the verified correspondences of each
+            successful image pair are visualized to this directory, within the same task that estimates them.
+
+    Returns:
+        Two-view output for each image pair.
+    """
 
-    def apply_two_view_estimator(
+    def apply_two_view_estimator_batch(
         two_view_estimator: TwoViewEstimator,
-        keypoints_i1: Keypoints,
-        keypoints_i2: Keypoints,
-        putative_corr_idxs: np.ndarray,
-        camera_intrinsics_i1: gtsfm_types.CALIBRATION_TYPE,
-        camera_intrinsics_i2: gtsfm_types.CALIBRATION_TYPE,
-        i2Ti1_prior: Optional[PosePrior],
-        gt_camera_i1: Optional[gtsfm_types.CAMERA_TYPE],
-        gt_camera_i2: Optional[gtsfm_types.CAMERA_TYPE],
+        batch_pairs: List[Tuple[int, int]],
+        batch_kwargs: List[Dict[str, Any]],
         gt_scene_mesh: Optional[Any] = None,
-    ) -> TWO_VIEW_OUTPUT:
-        return two_view_estimator.run_2view(
-            keypoints_i1=keypoints_i1,
-            keypoints_i2=keypoints_i2,
-            putative_corr_idxs=putative_corr_idxs,
-            camera_intrinsics_i1=camera_intrinsics_i1,
-            camera_intrinsics_i2=camera_intrinsics_i2,
-            i2Ti1_prior=i2Ti1_prior,
-            gt_camera_i1=gt_camera_i1,
-            gt_camera_i2=gt_camera_i2,
-            gt_scene_mesh=gt_scene_mesh,
-        )
+        batch_images: Optional[List[Tuple[Image, Image]]] = None,
+        correspondences_viz_dir: Optional[str] = None,
+    ) -> List[TWO_VIEW_OUTPUT]:
+        batch_outputs = []
+        for pair_idx, ((i1, i2), kwargs) in enumerate(zip(batch_pairs, batch_kwargs)):
+            two_view_output = two_view_estimator.run_2view(**kwargs, gt_scene_mesh=gt_scene_mesh)
+            if batch_images is not None and correspondences_viz_dir is not None:
+                image_i1, image_i2 = batch_images[pair_idx]
+                save_two_view_correspondences_viz(
+                    i1,
+                    i2,
+                    image_i1,
+                    image_i2,
+                    kwargs["keypoints_i1"],
+                    kwargs["keypoints_i2"],
+                    two_view_output,
+                    correspondences_viz_dir,
+                )
+            batch_outputs.append(two_view_output)
+        return batch_outputs
+
+    image_pairs = list(putative_corr_idxs_dict.keys())
+    if batch_size is None:
+        num_threads = max(sum(client.nthreads().values()), 1)
+        batch_size = max(1, int(np.ceil(len(image_pairs) / (NUM_TWO_VIEW_BATCHES_PER_THREAD * num_threads))))
+    pair_batches = [image_pairs[start : start + batch_size] for start in range(0, len(image_pairs), batch_size)]
+    save_viz = images is not None and correspondences_viz_dir is not None
 
     two_view_estimator_future = client.scatter(two_view_estimator, broadcast=False)
 
-    two_view_output_futures = {
-        (i1, i2): client.submit(
-            apply_two_view_estimator,
+    batch_futures = [
+        client.submit(
+            apply_two_view_estimator_batch,
             two_view_estimator_future,
-            keypoints_list[i1],
-            keypoints_list[i2],
-            putative_corr_idxs,
-            camera_intrinsics[i1],
-            camera_intrinsics[i2],
-            relative_pose_priors.get((i1, i2)),
-            gt_cameras[i1],
-            gt_cameras[i2],
+            pair_batch,
+            [
+                {
+                    "keypoints_i1": keypoints_list[i1],
+                    "keypoints_i2": keypoints_list[i2],
+                    "putative_corr_idxs": putative_corr_idxs_dict[(i1, i2)],
+                    "camera_intrinsics_i1": camera_intrinsics[i1],
+                    "camera_intrinsics_i2": camera_intrinsics[i2],
+                    "i2Ti1_prior": relative_pose_priors.get((i1, i2)),
+                    "gt_camera_i1": gt_cameras[i1],
+                    "gt_camera_i2": gt_cameras[i2],
+                }
+                for i1, i2 in pair_batch
+            ],
             gt_scene_mesh,
+            [(images[i1], images[i2]) for i1, i2 in pair_batch] if save_viz else None,
+            correspondences_viz_dir if save_viz else None,
         )
-        for (i1, i2), putative_corr_idxs in putative_corr_idxs_dict.items()
+        for pair_batch in pair_batches
+    ]
+
+    batch_outputs = client.gather(batch_futures)
+    two_view_output_dict = {
+        pair: two_view_output
+        for pair_batch, batch_output in zip(pair_batches, batch_outputs)
+        for pair, two_view_output in zip(pair_batch, batch_output)
     }
-
-    two_view_output_dict = client.gather(two_view_output_futures)
     return two_view_output_dict
 
 
+def save_two_view_correspondences_viz(
+    i1: int,
+    i2: int,
+    image_i1: Image,
+    image_i2: Image,
+    keypoints_i1: Keypoints,
+    keypoints_i2: Keypoints,
+    two_view_output: TWO_VIEW_OUTPUT,
+    output_dir: str,
+) -> None:
+    """Saves the visualization of the verified correspondences of an image pair, if two-view estimation succeeded.
+
+    Args:
+        i1: Index of the first image.
+        i2: Index of the second image.
+        image_i1: First image.
+        image_i2: Second image.
+        keypoints_i1: Keypoints for the first image.
+        keypoints_i2: Keypoints for the second image.
+        two_view_output: Output of the two-view estimator for the pair.
+        output_dir: Directory where the visualization will be saved.
+    """
+    i2Ri1, i2Ui1, v_corr_idxs = two_view_output[0], two_view_output[1], two_view_output[2]
+    if i2Ri1 is None or i2Ui1 is None:
+        return
+
+    viz_utils.save_twoview_correspondences_viz(
+        image_i1,
+        image_i2,
+        keypoints_i1,
+        keypoints_i2,
+        v_corr_idxs,
+        two_view_report=two_view_output[5],
+        file_path=os.path.join(output_dir, f"{i1}_{i2}__{image_i1.file_name}_{image_i2.file_name}.jpg"),
+    )
+
+
 def get_two_view_reports_summary(
     two_view_report_dict: Dict[Tuple[int, int], TwoViewEstimationReport],
     images: List[Image],
@@ -602,12 +697,15 @@ def get_two_view_reports_summary(
     """
 
     def round_fn(x: Optional[float]) -> Optional[float]:
-        return round(x, 2) if x else None
+        return None if x is None else round(float(x), 2)
 
     metrics_list = []
 
     for (i1, i2), report in two_view_report_dict.items():
         # Note: if GT is unknown, then R_error_deg, U_error_deg, and inlier_ratio_gt_model will be None
+        has_reproj_errors_gt_model = (
+            report.reproj_error_gt_model is not None and report.v_corr_idxs_inlier_mask_gt is not None
+        )
         metrics_list.append(
             {
                 "i1": int(i1),
@@ -620,15 +718,11 @@ def get_two_view_reports_summary(
                 if report.num_inliers_gt_model is not None
                 else None,
                 "inlier_ratio_gt_model": round_fn(report.inlier_ratio_gt_model),
-                "inlier_avg_reproj_error_gt_model": round_fn(
-                    np.nanmean(report.reproj_error_gt_model[report.v_corr_idxs_inlier_mask_gt])
-                )
-                if report.reproj_error_gt_model is not None and report.v_corr_idxs_inlier_mask_gt is not None
+                "inlier_avg_reproj_error_gt_model": round_fn(report.inlier_avg_reproj_error_gt_model)
+                if has_reproj_errors_gt_model
                 else None,
-                "outlier_avg_reproj_error_gt_model": round_fn(
-                    np.nanmean(report.reproj_error_gt_model[np.logical_not(report.v_corr_idxs_inlier_mask_gt)])
-                )
-                if report.reproj_error_gt_model is not None and report.v_corr_idxs_inlier_mask_gt is not None
+                "outlier_avg_reproj_error_gt_model": round_fn(report.outlier_avg_reproj_error_gt_model)
+                if has_reproj_errors_gt_model
                 else None,
                 "inlier_ratio_est_model": round_fn(report.inlier_ratio_est_model),
                 "num_inliers_est_model": int(report.num_inliers_est_model)
@@ -2,7 +2,6 @@
 
 Authors: Ayush Baid
 """
-import logging
 from pathlib import Path
 from typing import Any, List, Optional
 
@@ -26,12 +25,6 @@ CACHE_ROOT_PATH = Path(__file__).resolve().parent.parent / "cache"
 
 logger = logger_utils.get_logger()
 
-mpl_logger = logging.getLogger("matplotlib")
-mpl_logger.setLevel(logging.WARNING)
-
-pil_logger = logging.getLogger("PIL")
-pil_logger.setLevel(logging.INFO)
-
 
 class TwoViewEstimatorCacher(TwoViewEstimator):
     """Caches two-view relative pose estimation results for an image pair."""
@@ -62,22 +55,14 @@ class TwoViewEstimatorCacher(TwoViewEstimator):
         # Hash the concatenation of all the numpy arrays.
         return cache_utils.generate_hash_for_numpy_array(np.concatenate(numpy_arrays_to_hash))
 
-    def __load_result_from_cache(
-        self, keypoints_i1: Keypoints, keypoints_i2: Keypoints, putative_corr_idxs: np.ndarray
-    ) -> Optional[TWO_VIEW_OUTPUT]:
+    def __load_result_from_cache(self, cache_path: Path) -> Optional[TWO_VIEW_OUTPUT]:
         """Loads cached result, if it exists."""
-        cache_key = self.__generate_cache_key(keypoints_i1, keypoints_i2, putative_corr_idxs)
-        cache_path = self.__get_cache_path(cache_key=cache_key)
         # If bz2 file does not exist, `None` will be returned.
         cached_data = io_utils.read_from_bz2_file(cache_path)
         return cached_data
 
-    def __save_result_to_cache(
-        self, keypoints_i1: Keypoints, keypoints_i2: Keypoints, putative_corr_idxs: np.ndarray, result: TWO_VIEW_OUTPUT
-    ) -> None:
+    def __save_result_to_cache(self, cache_path: Path, result: TWO_VIEW_OUTPUT) -> None:
         """Saves the result (`TWO_VIEW_OUTPUT` 6-tuple) to the cache."""
-        cache_key = self.__generate_cache_key(keypoints_i1, keypoints_i2, putative_corr_idxs)
-        cache_path = self.__get_cache_path(cache_key=cache_key)
         io_utils.write_to_bz2_file(result, cache_path)
 
     def run_2view(
@@ -93,7 +78,26 @@ class TwoViewEstimatorCacher(TwoViewEstimator):
         gt_scene_mesh: Optional[Any] = None,
     ) -> TWO_VIEW_OUTPUT:
         """Loads 2-view estimation result if it exists in cache, otherwise re-runs two view estimator from scratch."""
-        result = self.__load_result_from_cache(keypoints_i1, keypoints_i2, putative_corr_idxs)
+        if putative_corr_idxs.shape[0] == 0:
+            # Without correspondences, the estimation is trivial, and the cache key would be the same for all such
+            # image pairs. Hence skip the cache entirely.
+            return self._two_view_estimator.run_2view(
+                keypoints_i1=keypoints_i1,
+                keypoints_i2=keypoints_i2,
+                putative_corr_idxs=putative_corr_idxs,
+                camera_intrinsics_i1=camera_intrinsics_i1,
+                camera_intrinsics_i2=camera_intrinsics_i2,
+                i2Ti1_prior=i2Ti1_prior,
+                gt_camera_i1=gt_camera_i1,
+                gt_camera_i2=gt_camera_i2,
+                gt_scene_mesh=gt_scene_mesh,
+            )
+
+        # The cache key is generated once, and used for both the lookup and the write on a cache miss.
+        cache_path = self.__get_cache_path(
+            cache_key=self.__generate_cache_key(keypoints_i1, keypoints_i2, putative_corr_idxs)
+        )
+        result = self.__load_result_from_cache(cache_path)
 
         if result is not None:
             return result
@@ -110,5 +114,5 @@ class TwoViewEstimatorCacher(TwoViewEstimator):
             gt_scene_mesh=gt_scene_mesh,
         )
 
-        self.__save_result_to_cache(keypoints_i1, keypoints_i2, putative_corr_idxs, result)
+        self.__save_result_to_cache(cache_path, result)
         return result
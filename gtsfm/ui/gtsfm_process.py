@@ -9,7 +9,7 @@ Author: Kevin Fu
 # ----------------------------------
 # from gtsfm.ui.gtsfm_process import GTSFMProcess, UiMetadata
 
-# 2: Subclass GTSFMProcess (this can replace ABCMeta, since it inherits from ABCMeta)
+# 2: Subclass GTSFMProcess (this can replace ABCMeta, since it inherits from abc.ABC)
 # ------------------------
 # class ClassName(GTSFMProcess):
 
@@ -29,7 +29,7 @@ import abc
 from dataclasses import dataclass
 from typing import Tuple
 
-from gtsfm.ui.registry import AbstractableRegistryHolder
+import gtsfm.ui.registry as registry
 
 
 @dataclass(frozen=True, order=True)
@@ -52,14 +52,22 @@ class UiMetadata:
     parent_plate: str = None
 
 
-class GTSFMProcess(metaclass=AbstractableRegistryHolder):
+class GTSFMProcess(abc.ABC):
     """Base type that all classes the REGISTRY can see must inherit from.
 
     Built as a Mixin. For example usage see test cases for GTSFMProcess.
     """
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Registers every subclass in the central REGISTRY when it is defined."""
+        super().__init_subclass__(**kwargs)
+        registry.register(cls)
+
     @staticmethod
     @abc.abstractmethod
     def get_ui_metadata() -> UiMetadata:
         """Returns data needed to display node and edge info for this process in the process graph."""
         ...
+
+
+registry.register(GTSFMProcess)
@@ -16,8 +16,8 @@ from typing import Set
 
 import pydot
 
+import gtsfm.ui.registry as registry
 from gtsfm.ui.gtsfm_process import UiMetadata
-from gtsfm.ui.registry import RegistryHolder
 
 PLOTS_ROOT = os.path.join(Path(__file__).resolve().parent.parent.parent, "plots")
 DEFAULT_GRAPH_VIZ_OUTPUT_PATH = os.path.join(PLOTS_ROOT, "process_graph_output.svg")
@@ -51,7 +51,7 @@ class ProcessGraphGenerator:
         self.is_image_correspondence = is_image_correspondence
 
     def _build_graph(self) -> None:
-        """Build graph based on RegistryHolder's REGISTRY."""
+        """Build graph based on the central REGISTRY."""
 
         unique_metadata = self._get_metadata_from_registry()
         # sort list to prevent non-deterministic DOT graph
@@ -74,7 +74,7 @@ class ProcessGraphGenerator:
         """
         unique_metadata = set()
 
-        for cls_name, cls_type in RegistryHolder.get_registry().items():
+        for cls_name, cls_type in registry.get_registry().items():
             # don't add the base class to the graph
             if cls_name == "GTSFMProcess":
                 continue
@@ -74,10 +74,9 @@ def align_poses_sim3_ignore_missing(
 
     num_cameras = len(aTi_list)
     # now at valid indices
-    aTi_list_ = [None] * num_cameras
-    for i in range(num_cameras):
-        if i in valid_camera_idxs:
-            aTi_list_[i] = valid_aTi_list_.pop(0)
+    aTi_list_: List[Optional[Pose3]] = [None] * num_cameras
+    for i, aTi_ in zip(valid_camera_idxs, valid_aTi_list_):
+        aTi_list_[i] = aTi_
 
     return aTi_list_, aSb
 
@@ -309,6 +308,24 @@ def compute_relative_unit_translation_angle(U_1: Optional[Unit3], U_2: Optional[
     return angle_deg
 
 
+def compute_angles_between_directions(U_1: np.ndarray, U_2: np.ndarray) -> np.ndarray:
+    """Computes the angles between pairs of (not necessarily unit-norm) direction vectors.
+
+    Args:
+        U_1: The first directions, as an array of shape (M,3).
+        U_2: The second directions, as an array of shape (M,3).
+
+    Returns:
+        The angle between each pair of directions, in degrees, as an array of shape (M,). NaN if either direction
+            has zero norm or is NaN.
+    """
+    norms = np.linalg.norm(U_1, axis=-1) * np.linalg.norm(U_2, axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cos_angle = np.sum(U_1 * U_2, axis=-1) / norms
+    cos_angle[norms == 0] = np.nan
+    return np.rad2deg(np.arccos(np.clip(cos_angle, -1, 1)))
+
+
 def compute_translation_to_direction_angle(
     i2Ui1: Optional[Unit3], wTi2: Optional[Pose3], wTi1: Optional[Pose3]
 ) -> Optional[float]:
@@ -370,6 +387,64 @@ def compute_cyclic_rotation_error(i1Ri0: Rot3, i2Ri1: Rot3, i2Ri0: Rot3) -> floa
     return compute_relative_rotation_angle(Rot3(), i0Ri0_from_cycle)
 
 
+def compute_cyclic_rotation_errors(
+    i1Ri0_matrices: np.ndarray, i2Ri1_matrices: np.ndarray, i2Ri0_matrices: np.ndarray
+) -> np.ndarray:
+    """Computes the cycle errors in degrees for a batch of triplets, see `compute_cyclic_rotation_error`.
+
+    The cycles are composed with batched matrix products, and the angles of all cycle rotations are then computed
+    at once.
+
+    Args:
+        i1Ri0_matrices: Relative rotations of camera i0 with respect to i1, as an array of shape (T,3,3).
+        i2Ri1_matrices: Relative rotations of camera i1 with respect to i2, as an array of shape (T,3,3).
+        i2Ri0_matrices: Relative rotations of camera i0 with respect to i2, as an array of shape (T,3,3).
+
+    Returns:
+        Cyclic rotation errors in degrees, as an array of shape (T,).
+    """
+    i0Ri0_from_cycle = np.swapaxes(i2Ri0_matrices, -1, -2) @ i2Ri1_matrices @ i1Ri0_matrices
+    return _compute_rotation_matrix_angles(i0Ri0_from_cycle)
+
+
+def compute_relative_rotation_angles(R_1_matrices: np.ndarray, R_2_matrices: np.ndarray) -> np.ndarray:
+    """Computes the angles between pairs of rotations, see `compute_relative_rotation_angle`.
+
+    Args:
+        R_1_matrices: The first rotations, as an array of shape (M,3,3).
+        R_2_matrices: The second rotations, as an array of shape (M,3,3).
+
+    Returns:
+        The angle between each pair of rotations, in degrees, as an array of shape (M,).
+    """
+    return _compute_rotation_matrix_angles(np.swapaxes(R_1_matrices, -1, -2) @ R_2_matrices)
+
+
+def _compute_rotation_matrix_angles(R_matrices: np.ndarray) -> np.ndarray:
+    """Computes the angle (norm of the angle-axis representation) of a batch of rotation matrices.
+
+    The angle is recovered from the trace and the skew-symmetric part with arctan2, which is accurate for small as
+    well as large angles.
+
+    Args:
+        R_matrices: Rotation matrices, as an array of shape (M,3,3).
+
+    Returns:
+        Rotation angles in degrees, as an array of shape (M,).
+    """
+    cos_angle = (np.trace(R_matrices, axis1=-2, axis2=-1) - 1) / 2
+    skew = np.stack(
+        [
+            R_matrices[:, 2, 1] - R_matrices[:, 1, 2],
+            R_matrices[:, 0, 2] - R_matrices[:, 2, 0],
+            R_matrices[:, 1, 0] - R_matrices[:, 0, 1],
+        ],
+        axis=-1,
+    )
+    sin_angle = np.linalg.norm(skew, axis=-1) / 2
+    return np.rad2deg(np.arctan2(sin_angle, cos_angle))
+
+
 def get_points_within_radius_of_cameras(
     wTi_list: List[Pose3], points_3d: np.ndarray, radius: float = 50
 ) -> Optional[np.ndarray]:
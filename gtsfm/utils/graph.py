@@ -16,6 +16,11 @@ from gtsfm.common.two_view_estimation_report import TwoViewEstimationReport
 GREEN = [0, 1, 0]
 RED = [1, 0, 0]
 
+# Above this number of edges, triplets are extracted with vectorized wedge checks instead of a loop over edges.
+DENSE_GRAPH_NUM_EDGES_THRESHOLD = 2000
+# Maximum number of wedges (paths a->b->c) materialized at once by the vectorized triplet extraction.
+MAX_WEDGES_PER_CHUNK = 2**22
+
 
 def get_nodes_in_largest_connected_component(edges: List[Tuple[int, int]]) -> List[int]:
     """Finds the nodes in the largest connected component of the bidirectional graph defined by the input edges.
@@ -108,31 +113,91 @@ def extract_cyclic_triplets_from_edges(edges: List[Tuple[int, int]]) -> List[Tup
     discovered a triplet. In other words, we need only look at the intersection between the nodes
     connected to `a` and the nodes connected to `b`.
 
+    The adjacency lists are stored as sorted integer arrays in CSR form, keeping only the neighbors with a larger
+    index than the node. Intersecting the lists of a and b (a < b) then yields exactly the nodes c > b, so each
+    triplet is found once, from its edge between the two smallest nodes, and no de-duplication is needed. Graphs with
+    more than DENSE_GRAPH_NUM_EDGES_THRESHOLD edges are instead handled with vectorized wedge checks.
+
     Args:
         edges: Indices of edges in the graph as a list of tuples.
 
     Returns:
-        triplets: 3-tuples of nodes that form a cycle. Nodes of each triplet are provided in sorted order.
+        triplets: 3-tuples of nodes that form a cycle. Nodes of each triplet are provided in sorted order, and the
+            triplets are sorted lexicographically.
     """
-    adj_list = create_adjacency_list(edges)
+    if len(edges) == 0:
+        return []
+
+    # Orient each edge from its smaller to its larger node, dropping self-loops and duplicate edges.
+    edges_arr = np.sort(np.asarray(list(edges), dtype=np.int64).reshape(-1, 2), axis=1)
+    edges_arr = np.unique(edges_arr[edges_arr[:, 0] != edges_arr[:, 1]], axis=0)
+    if len(edges_arr) == 0:
+        return []
 
-    # Only want to keep the unique ones.
-    triplets = set()
+    # Edges are sorted lexicographically, so the forward neighbors of each node are contiguous and sorted.
+    num_nodes = int(edges_arr.max()) + 1
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(edges_arr[:, 0], minlength=num_nodes))])
+    indices = edges_arr[:, 1]
 
-    # find intersections
-    for (a, b) in edges:
-        if a > b:
-            a, b = b, a
-
-        nodes_from_a = adj_list[a]
-        nodes_from_b = adj_list[b]
-        node_intersection = (nodes_from_a).intersection(nodes_from_b)
-        for node in node_intersection:
-            cycle_nodes = tuple(sorted([a, b, node]))
-            if cycle_nodes not in triplets:
-                triplets.add(cycle_nodes)
-
-    return list(triplets)
+    if len(edges_arr) > DENSE_GRAPH_NUM_EDGES_THRESHOLD:
+        return _extract_cyclic_triplets_from_wedges(edges_arr, indptr, indices, num_nodes)
+
+    triplets: List[Tuple[int, int, int]] = []
+    for a, b in edges_arr.tolist():
+        common_nodes = np.intersect1d(
+            indices[indptr[a] : indptr[a + 1]], indices[indptr[b] : indptr[b + 1]], assume_unique=True
+        )
+        triplets.extend((a, b, c) for c in common_nodes.tolist())
+
+    return triplets
+
+
+def _extract_cyclic_triplets_from_wedges(
+    edges_arr: np.ndarray, indptr: np.ndarray, indices: np.ndarray, num_nodes: int
+) -> List[Tuple[int, int, int]]:
+    """Extracts triplets without a Python loop over edges, for large graphs.
+
+    All wedges a->b->c (a < b < c) are enumerated from the forward CSR adjacency, and a wedge is a triplet if the
+    closing edge a->c exists, which is checked by binary search over the sorted edge codes a * num_nodes + c. Edges
+    are processed in chunks, to bound the memory used by the wedges.
+
+    Args:
+        edges_arr: Unique edges (a, b) with a < b, sorted lexicographically, as an array of shape (E,2).
+        indptr: CSR index pointers of the forward adjacency, of shape (num_nodes + 1,).
+        indices: CSR neighbor indices of the forward adjacency, of shape (E,).
+        num_nodes: Number of nodes in the graph.
+
+    Returns:
+        triplets: 3-tuples of nodes that form a cycle, in the same order as `extract_cyclic_triplets_from_edges`.
+    """
+    edge_codes = edges_arr[:, 0] * num_nodes + edges_arr[:, 1]
+    num_wedges_per_edge = indptr[edges_arr[:, 1] + 1] - indptr[edges_arr[:, 1]]
+    cumulative_num_wedges = np.cumsum(num_wedges_per_edge)
+    chunk_ends = np.searchsorted(
+        cumulative_num_wedges,
+        np.arange(MAX_WEDGES_PER_CHUNK, cumulative_num_wedges[-1], MAX_WEDGES_PER_CHUNK),
+        side="right",
+    )
+    chunk_bounds = np.unique(np.concatenate([[0], chunk_ends, [len(edges_arr)]]))
+
+    triplets_per_chunk = []
+    for start, end in zip(chunk_bounds[:-1], chunk_bounds[1:]):
+        num_wedges = num_wedges_per_edge[start:end]
+        if num_wedges.sum() == 0:
+            continue
+        a = np.repeat(edges_arr[start:end, 0], num_wedges)
+        b = np.repeat(edges_arr[start:end, 1], num_wedges)
+        offsets_in_edge = np.arange(len(a)) - np.repeat(np.cumsum(num_wedges) - num_wedges, num_wedges)
+        c = indices[indptr[b] + offsets_in_edge]
+
+        wedge_codes = a * num_nodes + c
+        closing_edge_idxs = np.minimum(np.searchsorted(edge_codes, wedge_codes), len(edge_codes) - 1)
+        is_triplet = edge_codes[closing_edge_idxs] == wedge_codes
+        triplets_per_chunk.append(np.stack([a, b, c], axis=1)[is_triplet])
+
+    if len(triplets_per_chunk) == 0:
+        return []
+    return [tuple(triplet) for triplet in np.concatenate(triplets_per_chunk).tolist()]
 
 
 def draw_view_graph_topology(
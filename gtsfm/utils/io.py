@@ -2,13 +2,13 @@
 
 Authors: Ayush Baid, John Lambert
 """
+import bz2
 import glob
 import os
 import pickle
-from bz2 import BZ2File
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import gtsam
 import h5py
@@ -110,11 +110,26 @@ def save_json_file(
         json_fpath: Path to file to create.
         data: Python dictionary or list to be serialized.
     """
-    os.makedirs(os.path.dirname(json_fpath), exist_ok=True)
-    with open(json_fpath, "w") as f:
-        # ignore_nan=False replaces any NaN with null so that RTF frontend can
-        # parse it
-        json.dump(data, f, indent=4, ignore_nan=True)
+    save_json_files([json_fpath], data)
+
+
+def save_json_files(
+    json_fpaths: Sequence[str],
+    data: Union[Dict[Any, Any], List[Any]],
+) -> None:
+    """Save a Python dictionary or list to several JSON files, serializing it only once.
+
+    Args:
+        json_fpaths: Paths to files to create.
+        data: Python dictionary or list to be serialized.
+    """
+    # ignore_nan=False replaces any NaN with null so that RTF frontend can
+    # parse it
+    json_str = json.dumps(data, indent=4, ignore_nan=True)
+    for json_fpath in json_fpaths:
+        os.makedirs(os.path.dirname(json_fpath), exist_ok=True)
+        with open(json_fpath, "w") as f:
+            f.write(json_str)
 
 
 def read_json_file(fpath: Union[str, Path]) -> Any:
@@ -174,6 +189,36 @@ def export_model_as_colmap_text(gtsfm_data: GtsfmData, images: List[Image], save
     write_points(gtsfm_data, images, save_dir)
 
 
+def _colmap_extrinsics_to_poses(qvecs: np.ndarray, tvecs: np.ndarray) -> List[Pose3]:
+    """Converts COLMAP extrinsics (rotation quaternions and translations of world w.r.t. camera) to camera poses.
+
+    The rotation matrices of all cameras are computed at once from the (w, x, y, z) quaternions, using the same
+    expansion as COLMAP's `qvec2rotmat()`, and inverted in batch.
+
+    Args:
+        qvecs: Array of shape (N,4) with the quaternion (qw, qx, qy, qz) of each camera's rotation iRw.
+        tvecs: Array of shape (N,3) with each camera's translation iTw.
+
+    Returns:
+        List of N camera poses wTi.
+    """
+    qvecs = np.asarray(qvecs, dtype=np.float64).reshape(-1, 4)
+    tvecs = np.asarray(tvecs, dtype=np.float64).reshape(-1, 3)
+    w, x, y, z = qvecs.T
+    iRw = np.stack(
+        [
+            np.stack([1 - 2 * y**2 - 2 * z**2, 2 * x * y - 2 * w * z, 2 * z * x + 2 * w * y], axis=-1),
+            np.stack([2 * x * y + 2 * w * z, 1 - 2 * x**2 - 2 * z**2, 2 * y * z - 2 * w * x], axis=-1),
+            np.stack([2 * z * x - 2 * w * y, 2 * y * z + 2 * w * x, 1 - 2 * x**2 - 2 * y**2], axis=-1),
+        ],
+        axis=-2,
+    )
+    # Inverse of (iRw, itw) is (iRw^T, -iRw^T @ itw).
+    wRi = np.transpose(iRw, (0, 2, 1))
+    wti = -np.einsum("nij,nj->ni", wRi, tvecs)
+    return [Pose3(Rot3(wRi[i]), wti[i]) for i in range(len(wRi))]
+
+
 def colmap2gtsfm(
     cameras: Dict[int, ColmapCamera],
     images: Dict[int, ColmapImage],
@@ -200,10 +245,12 @@ def colmap2gtsfm(
     # Note: Assumes input cameras use `PINHOLE` model
     if len(images) == 0 and len(cameras) == 0:
         raise RuntimeError("No Image or Camera data provided to loader.")
-    intrinsics_gtsfm, wTi_gtsfm, img_fnames, img_dims = [], [], [], []
+    intrinsics_gtsfm, img_fnames, img_dims = [], [], []
+    wTi_gtsfm = _colmap_extrinsics_to_poses(
+        np.array([img.qvec for img in images.values()]), np.array([img.tvec for img in images.values()])
+    )
     image_id_to_idx = {}  # keeps track of discrepencies between `image_id` and List index.
     for idx, img in enumerate(images.values()):
-        wTi_gtsfm.append(Pose3(Rot3(img.qvec2rotmat()), img.tvec).inverse())
         img_fnames.append(img.name)
         camera_model_name = cameras[img.camera_id].model
         if camera_model_name == "SIMPLE_RADIAL":
@@ -362,17 +409,15 @@ def read_images_txt(fpath: str) -> Tuple[List[Pose3], List[str]]:
     with open(fpath, "r") as f:
         lines = f.readlines()
 
-    wTi_list = []
-    img_fnames = []
     # Ignore first 4 lines of text -- they contain a description of the file format
     # and a record of the number of reconstructed images.
-    for line in lines[4::2]:
-        i, qw, qx, qy, qz, tx, ty, tz, i, img_fname = line.split()
-        # Colmap provides extrinsics, so must invert
-        iRw = Rot3(float(qw), float(qx), float(qy), float(qz))
-        wTi = Pose3(iRw, np.array([tx, ty, tz], dtype=np.float64)).inverse()
-        wTi_list.append(wTi)
-        img_fnames.append(img_fname)
+    # Each image line is IMAGE_ID, QW, QX, QY, QZ, TX, TY, TZ, CAMERA_ID, NAME.
+    image_rows = [line.split() for line in lines[4::2]]
+    extrinsics = np.array([row[1:8] for row in image_rows], dtype=np.float64).reshape(-1, 7)
+    img_fnames = [row[9] for row in image_rows]
+
+    # Colmap provides extrinsics, so must invert
+    wTi_list = _colmap_extrinsics_to_poses(extrinsics[:, :4], extrinsics[:, 4:])
 
     # TODO(johnwlambert): Re-order tracks for COLMAP-formatted .bin files.
     wTi_list_sorted, img_fnames_sorted = sort_image_filenames_lexigraphically(wTi_list, img_fnames)
@@ -613,7 +658,8 @@ def read_from_bz2_file(file_path: Path) -> Optional[Any]:
         return None
 
     try:
-        data = pickle.load(BZ2File(file_path, "rb"))
+        # Read and decompress the whole file at once, rather than unpickling from a stream of small buffered reads.
+        data = pickle.loads(bz2.decompress(file_path.read_bytes()))
     except Exception:
         logger.exception("Cache file was corrupted, removing it...")
         os.remove(file_path)
@@ -625,7 +671,7 @@ def read_from_bz2_file(file_path: Path) -> Optional[Any]:
 def write_to_bz2_file(data: Any, file_path: Path) -> None:
     """Writes data using pickle to a compressed file."""
     file_path.parent.mkdir(exist_ok=True, parents=True)
-    pickle.dump(data, BZ2File(file_path, "wb"))
+    file_path.write_bytes(bz2.compress(pickle.dumps(data)))
     if not file_path.exists():
         logger.debug("Cache file could not be written!")
 
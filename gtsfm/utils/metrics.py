@@ -12,7 +12,7 @@ from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 import matplotlib.pyplot as plt
 import numpy as np
 import seaborn as sns
-from gtsam import Cal3Bundler, EssentialMatrix, PinholeCameraCal3Bundler, Point3, Pose3, Rot3, Unit3
+from gtsam import Cal3Bundler, PinholeCameraCal3Bundler, Point3, Pose3, Rot3, Unit3
 from trimesh import Trimesh
 
 import gtsfm.utils.geometry_comparisons as comp_utils
@@ -118,8 +118,7 @@ def epipolar_inlier_correspondences(
         is_inlier: (N, ) mask of inlier correspondences.
         distance_squared: Squared sampson distance between corresponding keypoints.
     """
-    i2Ei1 = EssentialMatrix(i2Ti1.rotation(), Unit3(i2Ti1.translation()))
-    i2Fi1 = verification_utils.essential_to_fundamental_matrix(i2Ei1, intrinsics_i1, intrinsics_i2)
+    i2Fi1 = verification_utils.fundamental_from_pose(i2Ti1, intrinsics_i1, intrinsics_i2)
     distance_squared = verification_utils.compute_epipolar_distances_sq_sampson(
         keypoints_i1.coordinates, keypoints_i2.coordinates, i2Fi1
     )
@@ -211,7 +210,7 @@ def compute_keypoint_intersections(
     return keypoint_ind, intersections
 
 
-def compute_rotation_angle_metric(wRi_list: List[Optional[Rot3]], gt_wRi_list: List[Optional[Pose3]]) -> GtsfmMetric:
+def compute_rotation_angle_metric(wRi_list: List[Optional[Rot3]], gt_wRi_list: List[Optional[Rot3]]) -> GtsfmMetric:
     """Computes statistics for the angle between estimated and GT rotations.
 
     Assumes that the estimated and GT rotations have been aligned and do not
@@ -224,12 +223,26 @@ def compute_rotation_angle_metric(wRi_list: List[Optional[Rot3]], gt_wRi_list: L
     Returns:
         A GtsfmMetric for the N rotation angle errors, in degrees.
     """
-    errors = []
-    for wRi, gt_wRi in zip(wRi_list, gt_wRi_list):
-        if wRi is not None and gt_wRi is not None:
-            errors.append(comp_utils.compute_relative_rotation_angle(wRi, gt_wRi))
-        else:
-            errors.append(np.nan)
+    is_valid = np.array(
+        [wRi is not None and gt_wRi is not None for wRi, gt_wRi in zip(wRi_list, gt_wRi_list)], dtype=bool
+    )
+    wRi_matrices = np.full((len(wRi_list), 3, 3), np.nan)
+    gt_wRi_matrices = np.full((len(wRi_list), 3, 3), np.nan)
+    for i in np.flatnonzero(is_valid):
+        wRi_matrices[i] = wRi_list[i].matrix()
+        gt_wRi_matrices[i] = gt_wRi_list[i].matrix()
+    return _compute_rotation_angle_metric_from_matrices(wRi_matrices, gt_wRi_matrices, is_valid)
+
+
+def _compute_rotation_angle_metric_from_matrices(
+    wRi_matrices: np.ndarray, gt_wRi_matrices: np.ndarray, is_valid: np.ndarray
+) -> GtsfmMetric:
+    """Computes the rotation angle metric from stacked (N,3,3) rotation matrices; entries not valid are NaN."""
+    errors = np.full(len(is_valid), np.nan)
+    if np.any(is_valid):
+        errors[is_valid] = comp_utils.compute_relative_rotation_angles(
+            wRi_matrices[is_valid], gt_wRi_matrices[is_valid]
+        )
     return GtsfmMetric("rotation_angle_error_deg", errors)
 
 
@@ -248,10 +261,22 @@ def compute_translation_distance_metric(
     Returns:
         A statistics dict of the metrics errors in degrees.
     """
-    errors = []
-    for wti, gt_wti in zip(wti_list, gt_wti_list):
-        if wti is not None and gt_wti is not None:
-            errors.append(comp_utils.compute_points_distance_l2(wti, gt_wti))
+    is_valid = np.array(
+        [wti is not None and gt_wti is not None for wti, gt_wti in zip(wti_list, gt_wti_list)], dtype=bool
+    )
+    wti_array = np.full((len(wti_list), 3), np.nan)
+    gt_wti_array = np.full((len(wti_list), 3), np.nan)
+    for i in np.flatnonzero(is_valid):
+        wti_array[i] = wti_list[i]
+        gt_wti_array[i] = gt_wti_list[i]
+    return _compute_translation_distance_metric_from_vectors(wti_array, gt_wti_array, is_valid)
+
+
+def _compute_translation_distance_metric_from_vectors(
+    wti_array: np.ndarray, gt_wti_array: np.ndarray, is_valid: np.ndarray
+) -> GtsfmMetric:
+    """Computes the translation distance metric from stacked (N,3) translations, only over valid entries."""
+    errors = np.linalg.norm(wti_array[is_valid] - gt_wti_array[is_valid], axis=1)
     return GtsfmMetric("translation_error_distance", errors)
 
 
@@ -267,11 +292,22 @@ def compute_relative_translation_angle_metric(
     Returns:
         A GtsfmMetric for the relative translation angle errors, in degrees.
     """
-    angles: List[Optional[float]] = []
-    for i1, i2 in i2Ui1_dict:
-        i2Ui1 = i2Ui1_dict[(i1, i2)]
-        angles.append(comp_utils.compute_translation_to_direction_angle(i2Ui1, wTi_list[i2], wTi_list[i1]))
-    return GtsfmMetric("relative_translation_angle_error_deg", np.array(angles, dtype=np.float32))
+    edges = np.array(list(i2Ui1_dict.keys()), dtype=np.int64).reshape(-1, 2)
+    i2Ui1_measured = np.array(
+        [np.full(3, np.nan) if i2Ui1 is None else i2Ui1.point3() for i2Ui1 in i2Ui1_dict.values()]
+    ).reshape(-1, 3)
+
+    # Direction of i1 w.r.t. i2 from the estimated poses, i.e. translation of i2Ti1 = inv(wRi2) * (wti1 - wti2).
+    # Edges with a missing pose get NaN angles, since their stacked matrices are NaN.
+    wTi_matrices, _ = stack_pose_matrices(wTi_list)
+    wTi1_matrices = wTi_matrices[edges[:, 0]]
+    wTi2_matrices = wTi_matrices[edges[:, 1]]
+    i2ti1_estimated = np.einsum(
+        "eji,ej->ei", wTi2_matrices[:, :3, :3], wTi1_matrices[:, :3, 3] - wTi2_matrices[:, :3, 3]
+    )
+
+    angles = comp_utils.compute_angles_between_directions(i2Ui1_measured, i2ti1_estimated)
+    return GtsfmMetric("relative_translation_angle_error_deg", angles.astype(np.float32))
 
 
 def compute_translation_angle_metric(
@@ -293,16 +329,11 @@ def compute_translation_angle_metric(
             f"Lists of ground truth camera poses {N1} and estimated camera poses {N2} must have the same cardinality."
         )
 
-    angles = []
-    for wTi, wTi_gt in zip(wTi_list, gt_wTi_list):
-        if wTi is not None:
-            wUi_est = Unit3(wTi.translation())
-            wUi_gt = Unit3(wTi_gt.translation())
-            angle = comp_utils.compute_relative_unit_translation_angle(wUi_est, wUi_gt)
-        else:
-            angle = np.nan
-        angles.append(angle)
-    return GtsfmMetric("translation_angle_error_deg", np.array(angles, dtype=np.float32))
+    # Cameras with a missing pose get NaN angles, since their stacked matrices are NaN.
+    wTi_matrices, _ = stack_pose_matrices(wTi_list)
+    gt_wTi_matrices, _ = stack_pose_matrices(gt_wTi_list)
+    angles = comp_utils.compute_angles_between_directions(wTi_matrices[:, :3, 3], gt_wTi_matrices[:, :3, 3])
+    return GtsfmMetric("translation_angle_error_deg", angles.astype(np.float32))
 
 
 def compute_pose_auc_metric(
@@ -356,12 +387,22 @@ def compute_ba_pose_metrics(
     wTi_aligned_list = ba_output.get_camera_poses()
     i2Ui1_dict_gt = get_twoview_translation_directions(gt_wTi_list)
 
-    wRi_aligned_list, wti_aligned_list = get_rotations_translations_from_poses(wTi_aligned_list)
-    gt_wRi_list, gt_wti_list = get_rotations_translations_from_poses(gt_wTi_list)
+    # Fetch each pose from GTSAM once, as a matrix, and slice rotations and translations from the stacked matrices.
+    wTi_aligned_matrices, is_valid_aligned = stack_pose_matrices(wTi_aligned_list)
+    gt_wTi_matrices, is_valid_gt = stack_pose_matrices(gt_wTi_list)
+    is_valid = is_valid_aligned & is_valid_gt
 
     metrics = []
-    metrics.append(compute_rotation_angle_metric(wRi_aligned_list, gt_wRi_list))
-    metrics.append(compute_translation_distance_metric(wti_aligned_list, gt_wti_list))
+    metrics.append(
+        _compute_rotation_angle_metric_from_matrices(
+            wTi_aligned_matrices[:, :3, :3], gt_wTi_matrices[:, :3, :3], is_valid
+        )
+    )
+    metrics.append(
+        _compute_translation_distance_metric_from_vectors(
+            wTi_aligned_matrices[:, :3, 3], gt_wTi_matrices[:, :3, 3], is_valid
+        )
+    )
     metrics.append(compute_relative_translation_angle_metric(i2Ui1_dict_gt, wTi_aligned_list))
     metrics.append(compute_translation_angle_metric(gt_wTi_list, wTi_aligned_list))
 
@@ -437,15 +478,33 @@ def get_rotations_translations_from_poses(
     return rotations, translations
 
 
-def save_metrics_as_json(metrics_groups: List[GtsfmMetricsGroup], output_dir: str) -> None:
+def stack_pose_matrices(poses: List[Optional[Pose3]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Stacks the 4x4 matrices of the poses, fetching each pose from GTSAM only once.
+
+    Args:
+        poses: List of N (optional) poses.
+
+    Returns:
+        Array of shape (N,4,4) with the pose matrices, NaN for missing poses.
+        Boolean array of shape (N,), indicating which poses are available.
+    """
+    is_valid = np.array([pose is not None for pose in poses], dtype=bool)
+    matrices = np.full((len(poses), 4, 4), np.nan)
+    for i in np.flatnonzero(is_valid):
+        matrices[i] = poses[i].matrix()
+    return matrices, is_valid
+
+
+def save_metrics_as_json(metrics_groups: List[GtsfmMetricsGroup], output_dir: Union[str, Sequence[str]]) -> None:
     """Saves the input metrics groups as JSON files using the name of the group.
 
     Args:
         metrics_groups: List of GtsfmMetricsGroup to be saved.
-        output_dir: Directory to save metrics to.
+        output_dir: Directory to save metrics to, or several directories. Each group is serialized only once.
     """
+    output_dirs = [output_dir] if isinstance(output_dir, str) else output_dir
     for metrics_group in metrics_groups:
-        metrics_group.save_to_json(os.path.join(output_dir, metrics_group.name + ".json"))
+        metrics_group.save_to_json([os.path.join(d, metrics_group.name + ".json") for d in output_dirs])
 
 
 def get_metrics_for_sfmdata(gtsfm_data: GtsfmData, suffix: str, store_full_data: bool = False) -> List[GtsfmMetric]:
@@ -126,6 +126,28 @@ def essential_to_fundamental_matrix(
     return np.linalg.inv(camera_intrinsics_i2.K().T) @ i2Ei1.matrix() @ np.linalg.inv(camera_intrinsics_i1.K())
 
 
+def fundamental_from_pose(
+    i2Ti1: Pose3, camera_intrinsics_i1: Cal3Bundler, camera_intrinsics_i2: Cal3Bundler
+) -> np.ndarray:
+    """Computes the fundamental matrix from the relative pose and camera intrinsics.
+
+    Equivalent to `essential_to_fundamental_matrix(EssentialMatrix(i2Ri1, Unit3(i2ti1)), ...)`, but forms the essential
+    matrix [i2ui1]_x @ i2Ri1 directly in numpy instead of constructing GTSAM objects.
+
+    Args:
+        i2Ti1: relative pose of camera i1 in the frame of camera i2.
+        camera_intrinsics_i1: intrinsics for image #i1.
+        camera_intrinsics_i2: intrinsics for image #i2.
+
+    Returns:
+        Fundamental matrix i2Fi1 as numpy array of shape (3x3).
+    """
+    tx, ty, tz = i2Ti1.translation() / np.linalg.norm(i2Ti1.translation())
+    i2ui1_skew = np.array([[0.0, -tz, ty], [tz, 0.0, -tx], [-ty, tx, 0.0]])
+    i2Ei1 = i2ui1_skew @ i2Ti1.rotation().matrix()
+    return np.linalg.solve(camera_intrinsics_i2.K().T, i2Ei1) @ np.linalg.inv(camera_intrinsics_i1.K())
+
+
 def compute_epipolar_distances_sq_sed(
     coordinates_i1: np.ndarray, coordinates_i2: np.ndarray, i2Fi1: np.ndarray
 ) -> Optional[np.ndarray]:
@@ -203,12 +225,22 @@ def compute_epipolar_distances_sq_sampson(
     if coordinates_i1 is None or coordinates_i1.size == 0 or coordinates_i2 is None or coordinates_i2.size == 0:
         return None
 
-    epipolar_lines_i2 = feature_utils.convert_to_epipolar_lines(coordinates_i1, i2Fi1)  # Ex1
-    epipolar_lines_i1 = feature_utils.convert_to_epipolar_lines(coordinates_i2, i2Fi1.T)  # Etx2
-    line_sq_norms_i1 = np.sum(np.square(epipolar_lines_i1[:, :2]), axis=1)
-    line_sq_norms_i2 = np.sum(np.square(epipolar_lines_i2[:, :2]), axis=1)
+    # The epipolar constraint is expanded into elementwise ops on the coordinate columns, which avoids materializing
+    # homogeneous coordinates and Nx3 epipolar lines.
+    x1, y1 = coordinates_i1[:, 0], coordinates_i1[:, 1]
+    x2, y2 = coordinates_i2[:, 0], coordinates_i2[:, 1]
+    (f11, f12, f13), (f21, f22, f23), (f31, f32, f33) = i2Fi1
 
-    numerator = np.square(feature_utils.point_line_dotproduct(coordinates_i1, epipolar_lines_i1))
-    denominator = line_sq_norms_i1 + line_sq_norms_i2
+    # Normals of the epipolar lines l2 = i2Fi1 @ x1 and l1 = i2Fi1.T @ x2.
+    l2_a = f11 * x1 + f12 * y1 + f13
+    l2_b = f21 * x1 + f22 * y1 + f23
+    l1_a = f11 * x2 + f21 * y2 + f31
+    l1_b = f12 * x2 + f22 * y2 + f32
+
+    # x2.T @ i2Fi1 @ x1.
+    algebraic_error = x2 * l2_a + y2 * l2_b + (f31 * x1 + f32 * y1 + f33)
+
+    numerator = np.square(algebraic_error)
+    denominator = np.square(l1_a) + np.square(l1_b) + np.square(l2_a) + np.square(l2_b)
 
     return numerator / denominator
@@ -2,6 +2,7 @@
 
 Authors: Ayush Baid
 """
+import logging
 import os
 from typing import List, Optional, Tuple
 
@@ -17,11 +18,18 @@ import gtsfm.utils.io as io_utils
 from gtsfm.common.gtsfm_data import GtsfmData
 from gtsfm.common.image import Image
 from gtsfm.common.keypoints import Keypoints
-from gtsfm.two_view_estimator import TwoViewEstimationReport
+from gtsfm.common.two_view_estimation_report import TwoViewEstimationReport
 
 COLOR_RED = (255, 0, 0)
 COLOR_GREEN = (0, 255, 0)
 
+# Quiet the plotting libraries, in the module that actually uses them.
+mpl_logger = logging.getLogger("matplotlib")
+mpl_logger.setLevel(logging.WARNING)
+
+pil_logger = logging.getLogger("PIL")
+pil_logger.setLevel(logging.INFO)
+
 
 def set_axes_equal(ax: Axes):
     """Make axes of 3D plot have equal scale so that spheres appear as spheres, cubes as cubes, etc.
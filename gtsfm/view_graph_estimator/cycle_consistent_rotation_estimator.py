@@ -28,6 +28,10 @@ ERROR_THRESHOLD = 7.0
 # threshold for evaluation w.r.t. GT
 MAX_INLIER_MEASUREMENT_ERROR_DEG = 5.0
 
+# resolution of the saved debugging plots, and max number of cycles drawn in the per-cycle scatter plot
+PLOT_DPI = 150
+MAX_NUM_PLOTTED_CYCLES = 50000
+
 
 class EdgeErrorAggregationCriterion(str, Enum):
     """Aggregate cycle errors over each edge by choosing one of the following summary statistics:
@@ -110,26 +114,37 @@ class CycleConsistentRotationViewGraphEstimator(ViewGraphEstimatorBase):
 
         per_edge_errors = defaultdict(list)
         cycle_errors: List[float] = []
-        max_gt_error_in_cycle = []
+        max_gt_error_in_cycle = np.zeros(0)
 
-        # Compute the cycle error for each triplet, and add it to its edges for aggregation.
-        for i0, i1, i2 in triplets:  # sort order guaranteed
-            error = comp_utils.compute_cyclic_rotation_error(
-                i1Ri0=i2Ri1_dict[(i0, i1)], i2Ri1=i2Ri1_dict[(i1, i2)], i2Ri0=i2Ri1_dict[(i0, i2)]
+        if len(triplets) > 0:
+            # Gather per-edge quantities once, and index them by the 3 edges (i0,i1), (i1,i2), (i0,i2) of each triplet.
+            edge_idxs = {edge: edge_idx for edge_idx, edge in enumerate(i2Ri1_dict.keys())}
+            triplet_edge_idxs = np.array(
+                [[edge_idxs[(i0, i1)], edge_idxs[(i1, i2)], edge_idxs[(i0, i2)]] for i0, i1, i2 in triplets]
             )
-            cycle_errors.append(error)
+            rotation_matrices = np.stack([i2Ri1.matrix() for i2Ri1 in i2Ri1_dict.values()])
+            # GT rotation errors of each edge, NaN if ground truth is unknown.
+            gt_rot_errors = np.full(len(edge_idxs), np.nan)
+            for edge, edge_idx in edge_idxs.items():
+                report = two_view_reports.get(edge)
+                if report is not None and report.R_error_deg is not None:
+                    gt_rot_errors[edge_idx] = report.R_error_deg
+
+            # Compute the cycle errors of all triplets at once, from the stacked rotation matrices of their 3 edges.
+            cycle_errors = comp_utils.compute_cyclic_rotation_errors(
+                i1Ri0_matrices=rotation_matrices[triplet_edge_idxs[:, 0]],
+                i2Ri1_matrices=rotation_matrices[triplet_edge_idxs[:, 1]],
+                i2Ri0_matrices=rotation_matrices[triplet_edge_idxs[:, 2]],
+            ).tolist()
+            # Max GT error over the 3 edges of each cycle. NaN if ground truth is unknown for any edge.
+            max_gt_error_in_cycle = np.max(gt_rot_errors[triplet_edge_idxs], axis=1)
+
+        # Add the cycle error of each triplet to its edges for aggregation.
+        for (i0, i1, i2), error in zip(triplets, cycle_errors):  # sort order guaranteed
             per_edge_errors[(i0, i1)].append(error)
             per_edge_errors[(i1, i2)].append(error)
             per_edge_errors[(i0, i2)].append(error)
 
-            # Form 3 edges e_i, e_j, e_k between fully connected subgraph (nodes i0,i1,i2).
-            edges = [(i0, i1), (i1, i2), (i0, i2)]
-            rot_errors = [two_view_reports[e].R_error_deg for e in edges]
-            gt_known = all([err is not None for err in rot_errors])
-            # if ground truth unknown, cannot estimate error w.r.t. GT
-            max_rot_error = max(rot_errors) if gt_known else None
-            max_gt_error_in_cycle.append(max_rot_error)
-
         # Filter the edges based on the aggregate error.
         per_edge_aggregate_error = {
             pair_indices: self.__aggregate_errors_for_edge(errors) for pair_indices, errors in per_edge_errors.items()
@@ -155,7 +170,7 @@ class CycleConsistentRotationViewGraphEstimator(ViewGraphEstimatorBase):
         self,
         inlier_edges: Set[Tuple[int, int]],
         cycle_errors: List[float],
-        max_gt_error_in_cycle: List[float],
+        max_gt_error_in_cycle: np.ndarray,
         per_edge_aggregate_error: Dict[Tuple[int, int], float],
         two_view_reports_dict: Dict[Tuple[int, int], TwoViewEstimationReport],
         output_dir: Path,
@@ -165,7 +180,7 @@ class CycleConsistentRotationViewGraphEstimator(ViewGraphEstimatorBase):
         Args:
             inlier_edges: Set of all cycle consistent edges.
             cycle_errors: Cyclic error for all cycles.
-            max_gt_error_in_cycle: Maximum GT rotation error in the cycle, for all cycles.
+            max_gt_error_in_cycle: Maximum GT rotation error in the cycle, for all cycles (NaN if GT is unknown).
             per_edge_aggregate_error: Dict from edge index pair to aggregate cyclic error of the edge.
             two_view_reports_dict: Dict from edge index pair to the TwoViewEstimationReport of the edge.
             output_dir: Path to directory where outputs for debugging will be saved.
@@ -183,37 +198,50 @@ class CycleConsistentRotationViewGraphEstimator(ViewGraphEstimatorBase):
             else:
                 outlier_errors_aggregate.append(error_aggregate)
                 outlier_errors_wrt_gt.append(two_view_reports_dict[(i1, i2)].R_error_deg)
-        plt.scatter(
-            inlier_errors_aggregate,
-            inlier_errors_wrt_gt,
+        fig, ax = plt.subplots()
+        ax.scatter(
+            np.asarray(inlier_errors_aggregate, dtype=float),
+            np.asarray(inlier_errors_wrt_gt, dtype=float),
             10,
             color="g",
             marker=".",
             label=f"inliers @ {MAX_INLIER_MEASUREMENT_ERROR_DEG} deg.",
+            rasterized=True,
         )
-        plt.scatter(
-            outlier_errors_aggregate,
-            outlier_errors_wrt_gt,
+        ax.scatter(
+            np.asarray(outlier_errors_aggregate, dtype=float),
+            np.asarray(outlier_errors_wrt_gt, dtype=float),
             10,
             color="r",
             marker=".",
             label=f"outliers @ {MAX_INLIER_MEASUREMENT_ERROR_DEG} deg.",
+            rasterized=True,
         )
-        plt.xlabel(f"{self._edge_error_aggregation_criterion} cycle error")
-        plt.ylabel("Rotation error w.r.t GT")
-        plt.axis("equal")
-        plt.legend(loc="lower right")
-        plt.savefig(
-            os.path.join(output_dir, f"gt_err_vs_{self._edge_error_aggregation_criterion}_agg_error.jpg"), dpi=400
+        ax.set_xlabel(f"{self._edge_error_aggregation_criterion} cycle error")
+        ax.set_ylabel("Rotation error w.r.t GT")
+        ax.axis("equal")
+        ax.legend(loc="lower right")
+        fig.savefig(
+            os.path.join(output_dir, f"gt_err_vs_{self._edge_error_aggregation_criterion}_agg_error.jpg"),
+            dpi=PLOT_DPI,
         )
-        plt.close("all")
-
-        plt.scatter(cycle_errors, max_gt_error_in_cycle)
-        plt.xlabel("Cycle error")
-        plt.ylabel("Avg. Rot3 error over cycle triplet")
-        plt.axis("equal")
-        plt.savefig(os.path.join(output_dir, "cycle_error_vs_GT_rot_error.jpg"), dpi=400)
-        plt.close("all")
+        plt.close(fig)
+
+        # Plot a uniform random subset of the cycles for large graphs, as the number of cycles grows as O(E^1.5).
+        cycle_errors_arr = np.asarray(cycle_errors, dtype=float)
+        max_gt_error_in_cycle_arr = np.asarray(max_gt_error_in_cycle, dtype=float)
+        if len(cycle_errors_arr) > MAX_NUM_PLOTTED_CYCLES:
+            plotted_idxs = np.random.default_rng(0).choice(len(cycle_errors_arr), MAX_NUM_PLOTTED_CYCLES, replace=False)
+            cycle_errors_arr = cycle_errors_arr[plotted_idxs]
+            max_gt_error_in_cycle_arr = max_gt_error_in_cycle_arr[plotted_idxs]
+
+        fig, ax = plt.subplots()
+        ax.scatter(cycle_errors_arr, max_gt_error_in_cycle_arr, rasterized=True)
+        ax.set_xlabel("Cycle error")
+        ax.set_ylabel("Avg. Rot3 error over cycle triplet")
+        ax.axis("equal")
+        fig.savefig(os.path.join(output_dir, "cycle_error_vs_GT_rot_error.jpg"), dpi=PLOT_DPI)
+        plt.close(fig)
 
     def __aggregate_errors_for_edge(self, edge_errors: List[float]) -> float:
         """Aggregates a list of errors from different triplets into a single scalar value.
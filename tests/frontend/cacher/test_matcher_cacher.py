@@ -65,9 +65,9 @@ class TestMatcherCacher(unittest.TestCase):
             im_shape_i2=DUMMY_IM_SHAPE_I2,
         )
 
-        # assert that hash generation was called twice
+        # assert that hash generation was called once
         # TODO(ayushbaid): this need proper values
-        generate_hash_for_numpy_array_mock.assert_called()
+        generate_hash_for_numpy_array_mock.assert_called_once()
 
         # assert that read function was called once and write function was called once
         cache_path = ROOT_PATH / "cache" / "matcher" / "mock_matcher_numpy_key.pbz2"
@@ -102,9 +102,9 @@ class TestMatcherCacher(unittest.TestCase):
         # assert that underlying object was not called
         underlying_matcher_mock.match.assert_not_called()
 
-        # assert that hash generation was called twice
+        # assert that hash generation was called once
         # TODO(ayushbaid): this need proper values
-        generate_hash_for_numpy_array_mock.assert_called()
+        generate_hash_for_numpy_array_mock.assert_called_once()
 
         # assert that read function was called once and write function was called once
         cache_path = ROOT_PATH / "cache" / "matcher" / "mock_matcher_numpy_key.pbz2"
@@ -134,7 +134,7 @@ class TestVerifierBase(unittest.TestCase):
             intrinsics_i2,
             i2Ri1_expected=None,
             i2Ui1_expected=None,
-            verified_indices_expected=np.array([], dtype=np.uint32),
+            verified_indices_expected=np.zeros((0, 2), dtype=np.uint32),
         )
 
     def test_pickleable(self) -> None:
@@ -18,14 +18,15 @@ TEST_DATA_ROOT = Path(__file__).resolve().parent.parent / "data"
 
 
 class TestColmapLoader(unittest.TestCase):
-    def setUp(self):
-        """Set up the loader for the test."""
-        super().setUp()
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up the loader once, and share it across tests, since none of the tests modify it."""
+        super().setUpClass()
 
         colmap_files_dirpath = TEST_DATA_ROOT / "set1_lund_door/colmap_ground_truth"
         images_dir = TEST_DATA_ROOT / "set1_lund_door/images"
 
-        self.loader = ColmapLoader(
+        cls.loader = ColmapLoader(
             colmap_files_dirpath,
             images_dir,
             use_gt_intrinsics=True,
@@ -72,6 +73,17 @@ class TestColmapLoader(unittest.TestCase):
         assert np.isclose(px, px_orig * scale_u)
         assert np.isclose(py, py_orig * scale_v)
 
+    def test_get_camera_intrinsics_reads_image_once(self) -> None:
+        """Ensure that the image is read from disk only once to rescale the intrinsics of repeatedly queried frames."""
+        expected_K = self.loader.get_camera_intrinsics(0).K()
+        with patch.object(self.loader, "get_image_full_res", wraps=self.loader.get_image_full_res) as full_res_mock:
+            K = self.loader.get_camera_intrinsics(0).K()
+            gt_K = self.loader.get_gt_camera_intrinsics(0).K()
+            full_res_mock.assert_not_called()
+
+        np.testing.assert_allclose(K, expected_K)
+        np.testing.assert_allclose(gt_K, expected_K)
+
     def test_image_resolution(self) -> None:
         """Ensure that the image is downsampled properly to a max resolution of 500 px.
 
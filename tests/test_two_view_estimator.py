@@ -10,9 +10,16 @@ from gtsam import Cal3Bundler, EssentialMatrix, PinholeCameraCal3Bundler, Pose3,
 
 import gtsfm.utils.geometry_comparisons as comp_utils
 import gtsfm.utils.io as io_utils
+from gtsfm.common.image import Image
 from gtsfm.common.keypoints import Keypoints
-from gtsfm.two_view_estimator import TwoViewEstimator
+from gtsfm.common.two_view_estimation_report import TwoViewEstimationReport
 from gtsfm.data_association.point3d_initializer import TriangulationOptions, TriangulationSamplingMode
+from gtsfm.two_view_estimator import (
+    TwoViewEstimator,
+    aggregate_frontend_metrics,
+    generate_two_view_report,
+    get_two_view_reports_summary,
+)
 
 GTSAM_EXAMPLE_FILE = "5pointExample1.txt"
 EXAMPLE_DATA = io_utils.read_bal(gtsam.findExampleDataFile(GTSAM_EXAMPLE_FILE))
@@ -93,6 +100,114 @@ class TestTwoViewEstimator(unittest.TestCase):
         self.assertLessEqual(translation_angular_error, 1)
         np.testing.assert_allclose(corr_idxs, self.corr_idxs)
 
+    def test_generate_two_view_report_avg_reproj_errors(self):
+        """Tests that GT inlier/outlier average reprojection errors ignore NaNs and handle empty selections."""
+        report = generate_two_view_report(
+            inlier_ratio_est_model=1.0,
+            v_corr_idxs=np.zeros((4, 2), dtype=np.int32),
+            v_corr_idxs_inlier_mask_gt=np.array([True, True, True, False]),
+            reproj_error_gt_model=np.array([1.0, 2.0, 3.0, np.nan]),
+        )
+
+        self.assertEqual(report.num_inliers_gt_model, 3)
+        self.assertAlmostEqual(report.inlier_avg_reproj_error_gt_model, 2.0)
+        self.assertTrue(np.isnan(report.outlier_avg_reproj_error_gt_model))
+
+    def test_aggregate_frontend_metrics_with_missing_errors(self):
+        """Tests that success counts skip pairs without GT errors and pose error is the max of rotation/translation."""
+        reports_dict = {
+            (0, 1): TwoViewEstimationReport(
+                v_corr_idxs=np.zeros((2, 2)),
+                num_inliers_est_model=2,
+                inlier_ratio_gt_model=1.0,
+                R_error_deg=1.0,
+                U_error_deg=8.0,
+            ),
+            (0, 2): TwoViewEstimationReport(v_corr_idxs=np.zeros((0, 2)), num_inliers_est_model=0),
+            (1, 2): TwoViewEstimationReport(
+                v_corr_idxs=np.zeros((2, 2)),
+                num_inliers_est_model=2,
+                inlier_ratio_gt_model=0.5,
+                R_error_deg=3.0,
+                U_error_deg=2.0,
+            ),
+        }
+
+        metrics_group = aggregate_frontend_metrics(reports_dict, angular_err_threshold_deg=5, metric_group_name="test")
+        metrics = {metric.name: metric for metric in metrics_group.metrics}
+
+        self.assertEqual(metrics["num_input_image_pairs"].data, 3)
+        self.assertEqual(metrics["num_valid_image_pairs"].data, 2)
+        self.assertEqual(metrics["rotation_success_count"].data, 2)
+        self.assertEqual(metrics["translation_success_count"].data, 1)
+        self.assertEqual(metrics["pose_success_count"].data, 1)
+        self.assertEqual(metrics["num_all_inlier_correspondences_wrt_gt_model"].data, 1)
+        self.assertEqual(metrics["pose_errors_deg"].summary["max"], 8.0)
+
+    def test_get_two_view_reports_summary_rounding(self):
+        """Tests that float entries are rounded to 2 decimals, and that missing values are reported as None."""
+        reports_dict = {
+            (0, 1): TwoViewEstimationReport(
+                v_corr_idxs=np.zeros((2, 2)),
+                num_inliers_est_model=2,
+                inlier_ratio_est_model=0.66666,
+                num_inliers_gt_model=1,
+                inlier_ratio_gt_model=0.5,
+                v_corr_idxs_inlier_mask_gt=np.array([True, False]),
+                reproj_error_gt_model=np.array([1.234, 5.678]),
+                inlier_avg_reproj_error_gt_model=1.234,
+                outlier_avg_reproj_error_gt_model=5.678,
+                R_error_deg=1.23456,
+                U_error_deg=2.34567,
+            ),
+            (1, 2): TwoViewEstimationReport(v_corr_idxs=np.zeros((0, 2)), num_inliers_est_model=0),
+        }
+        images = [Image(value_array=np.zeros((2, 2)), file_name=f"{i}.jpg") for i in range(3)]
+
+        summary = get_two_view_reports_summary(reports_dict, images)
+
+        self.assertEqual(
+            summary[0],
+            {
+                "i1": 0,
+                "i2": 1,
+                "i1_filename": "0.jpg",
+                "i2_filename": "1.jpg",
+                "rotation_angular_error": 1.23,
+                "translation_angular_error": 2.35,
+                "num_inliers_gt_model": 1,
+                "inlier_ratio_gt_model": 0.5,
+                "inlier_avg_reproj_error_gt_model": 1.23,
+                "outlier_avg_reproj_error_gt_model": 5.68,
+                "inlier_ratio_est_model": 0.67,
+                "num_inliers_est_model": 2,
+            },
+        )
+        self.assertIsNone(summary[1]["rotation_angular_error"])
+        self.assertIsNone(summary[1]["inlier_avg_reproj_error_gt_model"])
+        self.assertIsNone(summary[1]["inlier_ratio_est_model"])
+
+    def test_get_two_view_reports_summary_keeps_zero_values(self):
+        """Tests that zero-valued errors and inlier ratios are kept, rather than being reported as missing."""
+        reports_dict = {
+            (0, 1): TwoViewEstimationReport(
+                v_corr_idxs=np.zeros((0, 2)),
+                num_inliers_est_model=0,
+                inlier_ratio_est_model=0.0,
+                inlier_ratio_gt_model=0.0,
+                R_error_deg=0.0,
+                U_error_deg=0.0,
+            )
+        }
+        images = [Image(value_array=np.zeros((2, 2)), file_name=f"{i}.jpg") for i in range(2)]
+
+        summary = get_two_view_reports_summary(reports_dict, images)
+
+        self.assertEqual(summary[0]["rotation_angular_error"], 0.0)
+        self.assertEqual(summary[0]["translation_angular_error"], 0.0)
+        self.assertEqual(summary[0]["inlier_ratio_gt_model"], 0.0)
+        self.assertEqual(summary[0]["inlier_ratio_est_model"], 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -24,8 +24,8 @@ class TestTwoViewEstimatorCacher(unittest.TestCase):
 
         self.keypoints_i1 = Keypoints(coordinates_i1)
         self.keypoints_i2 = Keypoints(coordinates_i2)
-        # Horizontally stack two (5,1) arrays to form (20,2).
-        self.corr_idxs = np.hstack([np.arange(5).reshape(-1, 1)] * 2)
+        # Match the first 5 keypoints of i1 to the first 5 keypoints of i2, forming a (5,2) array.
+        self.corr_idxs = np.repeat(np.arange(5).reshape(-1, 1), 2, axis=1)
 
         fx, k1, k2, u0, v0 = 583.1175, 0, 0, 507, 380
         calibration = Cal3Bundler(fx, k1, k2, u0, v0)
@@ -66,7 +66,7 @@ class TestTwoViewEstimatorCacher(unittest.TestCase):
         underlying_estimator_mock.run_2view.assert_called_once()
 
         # Assert that hash generation was called once.
-        generate_hash_for_numpy_array_mock.assert_called()
+        generate_hash_for_numpy_array_mock.assert_called_once()
 
         # Assert that read function was called once and write function was called once.
         cache_path = ROOT_PATH / "cache" / "two_view_estimator" / "numpy_key.pbz2"
@@ -120,6 +120,38 @@ class TestTwoViewEstimatorCacher(unittest.TestCase):
         # Assert that the write function was not called (as cache is mocked to already exist).
         write_mock.assert_not_called()
 
+    @patch("gtsfm.utils.cache.generate_hash_for_numpy_array", return_value="numpy_key")
+    @patch("gtsfm.utils.io.read_from_bz2_file", return_value=_DUMMY_OUTPUT)
+    @patch("gtsfm.utils.io.write_to_bz2_file")
+    def test_no_correspondences_bypasses_cache(
+        self, write_mock: MagicMock, read_mock: MagicMock, generate_hash_for_numpy_array_mock: MagicMock
+    ) -> None:
+        """Test that an image pair without putative correspondences is neither looked up in nor written to cache."""
+
+        # Mock the underlying two-view estimator, which should always be used for such pairs.
+        underlying_estimator_mock = MagicMock()
+        underlying_estimator_mock.run_2view.return_value = self.dummy_output
+
+        cacher = TwoViewEstimatorCacher(two_view_estimator_obj=underlying_estimator_mock)
+
+        result = cacher.run_2view(
+            keypoints_i1=self.keypoints_i1,
+            keypoints_i2=self.keypoints_i2,
+            putative_corr_idxs=np.zeros((0, 2), dtype=np.int32),
+            camera_intrinsics_i1=self.camera_intrinsics_i1,
+            camera_intrinsics_i2=self.camera_intrinsics_i2,
+            i2Ti1_prior=None,
+            gt_camera_i1=None,
+            gt_camera_i2=None,
+            gt_scene_mesh=None,
+        )
+
+        self.assertEqual(result, self.dummy_output)
+        underlying_estimator_mock.run_2view.assert_called_once()
+        generate_hash_for_numpy_array_mock.assert_not_called()
+        read_mock.assert_not_called()
+        write_mock.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,5 @@
 """
-Unit tests for RegistryHolder and GTSFMProcess.
+Unit tests for the registry and GTSFMProcess.
 
 Author: Kevin Fu
 """
@@ -7,8 +7,8 @@ Author: Kevin Fu
 import abc
 import unittest
 
+import gtsfm.ui.registry as registry
 from gtsfm.ui.gtsfm_process import GTSFMProcess, UiMetadata
-from gtsfm.ui.registry import RegistryHolder
 
 
 class FakeImageLoader(GTSFMProcess):
@@ -74,7 +74,7 @@ class TestRegistryUtils(unittest.TestCase):
         than just these test classes.)
         """
 
-        registry = RegistryHolder.get_registry()
+        registry_dict = registry.get_registry()
 
         expected_result = {
             "FakeImageLoader": FakeImageLoader,
@@ -83,8 +83,8 @@ class TestRegistryUtils(unittest.TestCase):
         }
 
         for cls_name, cls_type in expected_result.items():
-            self.assertTrue(cls_name in registry)
-            self.assertTrue(type(registry[cls_name]) is type(cls_type))
+            self.assertTrue(cls_name in registry_dict)
+            self.assertTrue(type(registry_dict[cls_name]) is type(cls_type))
 
     def test_basic(self):
         """Test basic storing of UI metadata."""
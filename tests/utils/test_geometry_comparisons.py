@@ -221,6 +221,22 @@ class TestGeometryComparisons(unittest.TestCase):
 
         np.testing.assert_allclose(computed_deg, expected_deg, rtol=1e-3, atol=1e-3)
 
+    def test_compute_relative_rotation_angles(self) -> None:
+        """Tests that batched relative angles match the angles computed for each pair of rotations."""
+        rng = np.random.default_rng(0)
+        R_1_list = [Rot3.Expmap(rng.normal(size=3)) for _ in range(20)]
+        R_2_list = [Rot3.Expmap(rng.normal(size=3)) for _ in range(19)] + [R_1_list[-1]]
+
+        computed_deg = geometry_comparisons.compute_relative_rotation_angles(
+            np.stack([R.matrix() for R in R_1_list]), np.stack([R.matrix() for R in R_2_list])
+        )
+
+        expected_deg = [
+            geometry_comparisons.compute_relative_rotation_angle(R_1, R_2) for R_1, R_2 in zip(R_1_list, R_2_list)
+        ]
+        np.testing.assert_allclose(computed_deg, expected_deg, atol=1e-6)
+        self.assertAlmostEqual(computed_deg[-1], 0.0)
+
     def test_compute_relative_rotation_angle2(self) -> None:
         """Tests the relative angle between two rotations
 
@@ -392,6 +408,23 @@ def test_compute_cyclic_rotation_error() -> None:
     assert np.isclose(cycle_error, 5)
 
 
+def test_compute_cyclic_rotation_errors() -> None:
+    """Ensure batched cycle errors match the per-triplet cycle error, for small and large cycle errors."""
+    rng = np.random.default_rng(0)
+    triplets = [[Rot3.Expmap(rng.normal(size=3)) for _ in range(3)] for _ in range(10)]
+    # A consistent cycle (zero error), and a cycle with a 5 degree error.
+    triplets.append([Rot3.Ry(np.deg2rad(30)), Rot3.Ry(np.deg2rad(60)), Rot3.Ry(np.deg2rad(90))])
+    triplets.append([Rot3.Ry(np.deg2rad(30)), Rot3.Ry(np.deg2rad(60)), Rot3.Ry(np.deg2rad(95))])
+
+    cycle_errors = geometry_comparisons.compute_cyclic_rotation_errors(
+        *[np.stack([triplet[k].matrix() for triplet in triplets]) for k in range(3)]
+    )
+
+    expected_cycle_errors = [geometry_comparisons.compute_cyclic_rotation_error(*triplet) for triplet in triplets]
+    np.testing.assert_allclose(cycle_errors, expected_cycle_errors, atol=1e-6)
+    np.testing.assert_allclose(cycle_errors[-2:], [0, 5], atol=1e-6)
+
+
 def test_is_valid_SO3() -> None:
     """Ensures that rotation matrices are accurately checked for SO(3) membership."""
     R = Rot3(np.eye(3))
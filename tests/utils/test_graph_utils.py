@@ -162,8 +162,21 @@ class TestGraphUtils(unittest.TestCase):
         triplets = graph_utils.extract_cyclic_triplets_from_edges(edges)
         assert isinstance(triplets, list)
         assert len(triplets) == 2
-        assert triplets[0] == (3, 4, 5)
-        assert triplets[1] == (1, 2, 3)
+        assert triplets[0] == (1, 2, 3)
+        assert triplets[1] == (3, 4, 5)
+
+    def test_extract_triplets_duplicate_edges(self) -> None:
+        """Ensure each triplet is reported once, even if edges are repeated in both orientations."""
+        edges = [(0, 1), (1, 2), (2, 0), (1, 0), (2, 2)]
+        triplets = graph_utils.extract_cyclic_triplets_from_edges(edges)
+        assert triplets == [(0, 1, 2)]
+
+    def test_extract_triplets_from_dict_keys(self) -> None:
+        """Ensure edges can be provided as the keys of a dictionary keyed by image pair, as done by the view graph
+        estimators."""
+        i2Ri1_dict = {(0, 1): None, (1, 2): None, (0, 2): None, (2, 3): None}
+        triplets = graph_utils.extract_cyclic_triplets_from_edges(i2Ri1_dict.keys())
+        assert triplets == [(0, 1, 2)]
 
     def test_triplet_extraction_correctness(self) -> None:
         """Ensure that for large graphs, the adjacency-list-based algorithm is still correct,
@@ -186,6 +199,20 @@ class TestGraphUtils(unittest.TestCase):
 
         assert set(triplets) == set(triplets_bf)
 
+    def test_triplet_extraction_dense_graph(self) -> None:
+        """Ensure that the vectorized extraction used for large graphs matches the adjacency-list intersection."""
+        pairs = np.random.randint(low=0, high=60, size=(500, 2))
+        edges = pairs[pairs[:, 0] != pairs[:, 1]].tolist()
+
+        triplets = graph_utils.extract_cyclic_triplets_from_edges(edges)
+        with mock.patch.object(graph_utils, "DENSE_GRAPH_NUM_EDGES_THRESHOLD", 0), mock.patch.object(
+            graph_utils, "MAX_WEDGES_PER_CHUNK", 100
+        ):
+            triplets_dense = graph_utils.extract_cyclic_triplets_from_edges(edges)
+
+        assert len(triplets) > 0
+        assert triplets_dense == triplets
+
     def test_create_adjacency_list(self) -> None:
         """Ensure the generated adjacency graph is empty, for a simple graph.
 
@@ -235,6 +235,22 @@ class TestIoUtils(unittest.TestCase):
             self.assertEqual(data_from_json["data"][0], None)
             np.testing.assert_allclose(data["data"][1:], data_from_json["data"][1:])
 
+    def test_bz2_roundtrip(self) -> None:
+        """Test that data written to a compressed cache file is read back, and that corrupted files are removed."""
+        data = {"keypoints": np.random.rand(10, 2), "indices": np.arange(5)}
+        with tempfile.TemporaryDirectory() as tempdir:
+            cache_fpath = Path(tempdir) / "cache" / "data.pbz2"
+            io_utils.write_to_bz2_file(data, cache_fpath)
+            data_from_cache = io_utils.read_from_bz2_file(cache_fpath)
+            np.testing.assert_allclose(data_from_cache["keypoints"], data["keypoints"])
+            np.testing.assert_array_equal(data_from_cache["indices"], data["indices"])
+
+            cache_fpath.write_bytes(b"not a bz2 file")
+            self.assertIsNone(io_utils.read_from_bz2_file(cache_fpath))
+            self.assertFalse(cache_fpath.exists())
+
+            self.assertIsNone(io_utils.read_from_bz2_file(Path(tempdir) / "missing.pbz2"))
+
     def test_sort_image_filenames_lexigraphically(self) -> None:
         """Tests that 5 image-camera pose pairs are sorted jointly according to file name."""
         wTi_list = [
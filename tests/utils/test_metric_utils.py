@@ -7,8 +7,9 @@ import unittest
 
 import numpy as np
 import trimesh
-from gtsam import Cal3Bundler, PinholeCameraCal3Bundler, Point3, Pose3, Rot3, SfmTrack
+from gtsam import Cal3Bundler, PinholeCameraCal3Bundler, Point3, Pose3, Rot3, SfmTrack, Unit3
 
+import gtsfm.utils.geometry_comparisons as comp_utils
 import gtsfm.utils.metrics as metric_utils
 from gtsfm.common.gtsfm_data import GtsfmData
 from gtsfm.common.keypoints import Keypoints
@@ -299,5 +300,53 @@ def test_pose_auc_works_for_nan_error() -> None:
     assert np.isclose(aucs[0], expected_auc_at_1_deg, atol=1e-3)
 
 
+def test_stack_pose_matrices() -> None:
+    """Ensure pose matrices are stacked in order, with NaN for missing poses."""
+    wTi_list = [Pose3(Rot3.Rz(0.3), Point3(1, 2, 3)), None, Pose3()]
+
+    matrices, is_valid = metric_utils.stack_pose_matrices(wTi_list)
+
+    np.testing.assert_array_equal(is_valid, [True, False, True])
+    np.testing.assert_allclose(matrices[0], wTi_list[0].matrix())
+    np.testing.assert_allclose(matrices[2], np.eye(4))
+    assert np.isnan(matrices[1]).all()
+
+
+def test_compute_rotation_angle_metric_with_missing_rotations() -> None:
+    """Ensure rotation errors are computed per camera, with NaN where a rotation is missing."""
+    wRi_list = [Rot3.Ry(np.deg2rad(10)), None, Rot3()]
+    gt_wRi_list = [Rot3(), Rot3(), Rot3.Rx(np.deg2rad(30))]
+
+    metric = metric_utils.compute_rotation_angle_metric(wRi_list, gt_wRi_list)
+
+    np.testing.assert_allclose(metric.data, [10, np.nan, 30], atol=1e-5)
+
+
+def test_compute_relative_translation_angle_metric_matches_per_edge_angles() -> None:
+    """Ensure batched relative translation angles match per-edge angles, with NaN for edges missing a pose."""
+    wTi_list = [
+        Pose3(Rot3.RzRyRx(0.1, -0.2, 0.3), Point3(1, 2, 3)),
+        Pose3(Rot3.RzRyRx(-0.4, 0.5, 0.2), Point3(-2, 0.5, 1)),
+        None,
+        Pose3(Rot3.RzRyRx(0.3, 0.1, -0.6), Point3(0, -1, 4)),
+    ]
+    i2Ui1_dict = {
+        (0, 1): Unit3(np.array([0.2, -0.5, 1.0])),
+        (1, 3): Unit3(np.array([-1.0, 0.3, 0.4])),
+        (0, 2): Unit3(np.array([0.0, 0.0, 1.0])),
+        (0, 3): None,
+    }
+
+    metric = metric_utils.compute_relative_translation_angle_metric(i2Ui1_dict, wTi_list)
+
+    expected = [
+        comp_utils.compute_translation_to_direction_angle(i2Ui1_dict[(0, 1)], wTi_list[1], wTi_list[0]),
+        comp_utils.compute_translation_to_direction_angle(i2Ui1_dict[(1, 3)], wTi_list[3], wTi_list[1]),
+        np.nan,
+        np.nan,
+    ]
+    np.testing.assert_allclose(metric.data, expected, atol=1e-3)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,7 +5,7 @@ Authors: Ayush Baid
 import unittest
 
 import numpy as np
-from gtsam import Cal3Bundler, Pose3, Rot3
+from gtsam import Cal3Bundler, EssentialMatrix, Pose3, Rot3, Unit3
 
 import gtsfm.utils.verification as verification_utils
 from tests.frontend.verifier.test_verifier_base import simulate_two_planes_scene
@@ -110,6 +110,18 @@ class TestVerificationUtils(unittest.TestCase):
         computed = verification_utils.compute_epipolar_distances_sq_sampson(points_i1, points_i2, i2Fi1)
         np.testing.assert_allclose(computed, expected, rtol=1e-3)
 
+    def test_fundamental_from_pose(self) -> None:
+        """Ensure the numpy fundamental matrix matches the one obtained through GTSAM's EssentialMatrix."""
+        i2Ti1 = Pose3(Rot3.RzRyRx(0.1, -0.3, 0.2), np.array([2.0, -1.0, 0.5]))
+        intrinsics_i1 = Cal3Bundler(500, 0, 0, 320, 240)
+        intrinsics_i2 = Cal3Bundler(700, 0, 0, 400, 300)
+
+        expected = verification_utils.essential_to_fundamental_matrix(
+            EssentialMatrix(i2Ti1.rotation(), Unit3(i2Ti1.translation())), intrinsics_i1, intrinsics_i2
+        )
+        computed = verification_utils.fundamental_from_pose(i2Ti1, intrinsics_i1, intrinsics_i2)
+        np.testing.assert_allclose(computed, expected, atol=1e-9)
+
     def test_recover_pose_from_projection_matrix_palace(self) -> None:
         """Ensure we can recover camera pose and intrinsics from GT camera projection matrix.
 